@@ -5,6 +5,11 @@ This shows how to use the server programmatically
 """
 
 import asyncio
+import json
+import os
+from itertools import islice
+from urllib.parse import urlparse
+
 from truenas_mcp_server import (
     list_users,
     get_user,
@@ -14,69 +19,129 @@ from truenas_mcp_server import (
     list_smb_shares
 )
 
-async def main():
-    print("TrueNAS Core MCP Server - Example Usage")
-    print("=" * 50)
+try:
+    import redis
+    import redis.asyncio as aioredis
+except ImportError:  # Redis is optional; examples simply run uncached
+    redis = None
+    aioredis = None
+
+# Shared across processes so repeated example runs skip the slow-changing lookups
+_REDIS = (
+    aioredis.Redis.from_url(os.getenv("REDIS_URL", "redis://localhost:6379/0"), decode_responses=True)
+    if aioredis else None
+)
+_HOST = urlparse(os.getenv("TRUENAS_URL", "")).hostname or "default"
+
+# Cap in-flight requests so a single-threaded middlewared is not flooded
+SEM = asyncio.Semaphore(int(os.getenv("TRUENAS_EXAMPLE_CONC", "4")))
+
+
+async def limited(coro):
+    """Await a coroutine while holding a slot in the example semaphore"""
+    async with SEM:
+        return await coro
+
+
+async def cached(key, ttl, coro_factory):
+    """
+    Return a tool result from Redis, or call the tool and cache a successful result
     
-    # Get system information
-    print("\n1. Getting system information...")
-    result = await get_system_info()
-    if result["success"]:
-        info = result["info"]
-        print(f"   Hostname: {info.get('hostname')}")
-        print(f"   Version: {info.get('version')}")
-        print(f"   Uptime: {info.get('uptime')}")
-    else:
-        print(f"   Error: {result['error']}")
+    Args:
+        key: Short endpoint name, namespaced as truenas:<key>:<hostname>
+        ttl: Time to live in seconds
+        coro_factory: Zero-argument callable returning the tool coroutine
+    """
+    if _REDIS is None:
+        return await coro_factory()
     
-    # List users
-    print("\n2. Listing users...")
-    result = await list_users()
-    if result["success"]:
-        users = result["users"]
-        custom_users = [u for u in users if not u["builtin"]]
-        print(f"   Total users: {result['count']}")
-        print(f"   Custom users: {len(custom_users)}")
-        for user in custom_users[:3]:  # Show first 3 custom users
-            print(f"   - {user['username']} ({user.get('full_name', 'No name')})")
-    else:
-        print(f"   Error: {result['error']}")
+    full_key = f"truenas:{key}:{_HOST}"
+    try:
+        hit = await _REDIS.get(full_key)
+    except (redis.RedisError, OSError):
+        return await coro_factory()
+    if hit is not None:
+        return json.loads(hit)
     
-    # List pools
-    print("\n3. Listing storage pools...")
-    result = await list_pools()
-    if result["success"]:
-        pools = result["pools"]
-        print(f"   Found {len(pools)} pools:")
-        for pool in pools:
-            print(f"   - {pool.get('name')} ({pool.get('status')})")
-    else:
-        print(f"   Error: {result['error']}")
+    result = await coro_factory()
+    if result.get("success"):
+        try:
+            await _REDIS.setex(full_key, ttl, json.dumps(result, default=str))
+        except (redis.RedisError, OSError):
+            pass
+    return result
+
+
+def _render_info(result):
+    info = result["info"]
+    print(f"   Hostname: {info.get('hostname')}")
+    print(f"   Version: {info.get('version')}")
+    print(f"   Uptime: {info.get('uptime')}")
+
+
+def _render_users(result):
+    users = result["users"]
+    print(f"   Total users: {result['metadata']['total_count']}")
+    print(f"   Custom users: {result['metadata']['regular_users']}")
+    # Stop scanning once the first 3 custom users are found
+    for user in islice((u for u in users if not u["builtin"]), 3):
+        print(f"   - {user['username']} ({user.get('full_name', 'No name')})")
+
+
+def _render_pools(result):
+    pools = result["pools"]
+    print(f"   Found {len(pools)} pools:")
+    for pool in pools:
+        print(f"   - {pool.get('name')} ({pool.get('status')})")
+
+
+def _render_datasets(result):
+    datasets = result["datasets"]
+    print(f"   Found {len(datasets)} datasets")
+    # Show first 5 datasets
+    for dataset in datasets[:5]:
+        print(f"   - {dataset.get('name')}")
+    if len(datasets) > 5:
+        print(f"   ... and {len(datasets) - 5} more")
+
+
+def _render_shares(result):
+    shares = result["shares"]
+    print(f"   Found {len(shares)} SMB shares:")
+    for share in shares:
+        print(f"   - {share.get('name')} -> {share.get('path')}")
+
+
+# (heading, coroutine factory, renderer) for each example step, in display order
+STEPS = (
+    ("1. System information:", lambda: cached("sysinfo", 300, get_system_info), _render_info),
+    ("2. Users:", list_users, _render_users),
+    ("3. Storage pools:", lambda: cached("pools", 60, list_pools), _render_pools),
+    ("4. Datasets:", lambda: cached("datasets", 60, list_datasets), _render_datasets),
+    ("5. SMB shares:", lambda: cached("smb", 300, list_smb_shares), _render_shares),
+)
+
+
+async def main():
+    print("TrueNAS Core MCP Server - Example Usage")
+    print("=" * 50)
     
-    # List datasets
-    print("\n4. Listing datasets...")
-    result = await list_datasets()
-    if result["success"]:
-        datasets = result["datasets"]
-        print(f"   Found {len(datasets)} datasets")
-        # Show first 5 datasets
-        for dataset in datasets[:5]:
-            print(f"   - {dataset.get('name')}")
-        if len(datasets) > 5:
-            print(f"   ... and {len(datasets) - 5} more")
-    else:
-        print(f"   Error: {result['error']}")
+    # The lookups are independent, so issue them concurrently and
+    # render the results in order once they have all completed.
+    print("\nFetching system information, users, pools, datasets and SMB shares...")
+    results = await asyncio.gather(
+        *(limited(factory()) for _, factory, _ in STEPS),
+        return_exceptions=True
+    )
     
-    # List SMB shares
-    print("\n5. Listing SMB shares...")
-    result = await list_smb_shares()
-    if result["success"]:
-        shares = result["shares"]
-        print(f"   Found {len(shares)} SMB shares:")
-        for share in shares:
-            print(f"   - {share.get('name')} -> {share.get('path')}")
-    else:
-        print(f"   Error: {result['error']}")
+    for (heading, _, render), result in zip(STEPS, results):
+        print(f"\n{heading}")
+        if isinstance(result, Exception):
+            print(f"   Error: {result}")
+        elif result["success"]:
+            render(result)
+        else:
+            print(f"   Error: {result['error']}")
 
 if __name__ == "__main__":
     # Note: Make sure .env is configured before running
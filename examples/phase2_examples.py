@@ -4,6 +4,9 @@ Advanced usage examples for Phase 2 features
 """
 
 import asyncio
+import os
+from typing import Final
+
 from truenas_mcp_server import (
     modify_dataset_permissions,
     update_dataset_acl,
@@ -15,6 +18,45 @@ from truenas_mcp_server import (
     create_snapshot_policy
 )
 
+# Cap in-flight requests so a single-threaded middlewared is not flooded
+SEM = asyncio.Semaphore(int(os.getenv("TRUENAS_EXAMPLE_CONC", "4")))
+
+
+async def limited(coro):
+    """Await a coroutine while holding a slot in the example semaphore"""
+    async with SEM:
+        return await coro
+
+
+# Example manifests are static, so build them once at import
+_NFS_PVC_YAML: Final[str] = """
+apiVersion: v1
+kind: PersistentVolumeClaim
+metadata:
+  name: nfs-pvc
+spec:
+  accessModes:
+    - ReadWriteMany
+  storageClassName: truenas-nfs-tank-k8s-nfs
+  resources:
+    requests:
+      storage: 10Gi
+"""
+
+_ISCSI_PVC_YAML: Final[str] = """
+apiVersion: v1
+kind: PersistentVolumeClaim
+metadata:
+  name: iscsi-pvc
+spec:
+  accessModes:
+    - ReadWriteOnce
+  storageClassName: truenas-iscsi-postgres-data
+  resources:
+    requests:
+      storage: 50Gi
+"""
+
 async def permission_examples():
     """Examples of permission management"""
     
@@ -162,45 +204,42 @@ async def advanced_scenarios():
     print("- Creating development dataset...")
     # (Assuming dataset already exists)
     
-    # Set properties
-    await modify_dataset_properties(
-        dataset="tank/development",
-        properties={
-            "compression": "lz4",
-            "atime": "off",
-            "quota": "200G"
-        }
-    )
-    
-    # Set permissions
-    await modify_dataset_permissions(
-        dataset="tank/development",
-        mode="770",
-        owner="devlead",
-        group="developers",
-        recursive=True
-    )
-    
-    # Create NFS export
-    await create_nfs_export(
-        dataset="tank/development",
-        allowed_networks=["10.10.0.0/24"],
-        read_only=False
-    )
-    
-    # Set up snapshots
-    await create_snapshot_policy(
-        dataset="tank/development",
-        name="dev-snapshots",
-        schedule={
-            "minute": "0",
-            "hour": "*/4",
-            "dom": "*",
-            "month": "*",
-            "dow": "*"
-        },
-        retention={"hourly": 24, "daily": 7},
-        recursive=True
+    # Properties, permissions, the NFS export and the snapshot policy are
+    # independent of each other, so configure them concurrently.
+    await asyncio.gather(
+        limited(modify_dataset_properties(
+            dataset="tank/development",
+            properties={
+                "compression": "lz4",
+                "atime": "off",
+                "quota": "200G"
+            }
+        )),
+        limited(modify_dataset_permissions(
+            dataset="tank/development",
+            mode="770",
+            owner="devlead",
+            group="developers",
+            recursive=True
+        )),
+        limited(create_nfs_export(
+            dataset="tank/development",
+            allowed_networks=["10.10.0.0/24"],
+            read_only=False
+        )),
+        limited(create_snapshot_policy(
+            dataset="tank/development",
+            name="dev-snapshots",
+            schedule={
+                "minute": "0",
+                "hour": "*/4",
+                "dom": "*",
+                "month": "*",
+                "dow": "*"
+            },
+            retention={"hourly": 24, "daily": 7},
+            recursive=True
+        ))
     )
     
     print("Development environment setup complete!\n")
@@ -212,40 +251,25 @@ def print_kubernetes_examples():
     print("\n=== Kubernetes Manifest Examples ===\n")
     
     print("Example PersistentVolumeClaim for NFS:")
-    print("""
-apiVersion: v1
-kind: PersistentVolumeClaim
-metadata:
-  name: nfs-pvc
-spec:
-  accessModes:
-    - ReadWriteMany
-  storageClassName: truenas-nfs-tank-k8s-nfs
-  resources:
-    requests:
-      storage: 10Gi
-""")
+    print(_NFS_PVC_YAML)
     
     print("\nExample PersistentVolumeClaim for iSCSI:")
-    print("""
-apiVersion: v1
-kind: PersistentVolumeClaim
-metadata:
-  name: iscsi-pvc
-spec:
-  accessModes:
-    - ReadWriteOnce
-  storageClassName: truenas-iscsi-postgres-data
-  resources:
-    requests:
-      storage: 50Gi
-""")
+    print(_ISCSI_PVC_YAML)
+
+async def _run_all():
+    """Run the example groups one after another on a single event loop"""
+    # Sequential so each group's output stays together; requests inside a
+    # group still overlap where they are independent
+    for group in (
+        permission_examples,
+        property_examples,
+        kubernetes_storage_examples,
+        automation_examples,
+        advanced_scenarios,
+    ):
+        await group()
 
 if __name__ == "__main__":
     # Run all examples
-    asyncio.run(permission_examples())
-    asyncio.run(property_examples())
-    asyncio.run(kubernetes_storage_examples())
-    asyncio.run(automation_examples())
-    asyncio.run(advanced_scenarios())
+    asyncio.run(_run_all())
     print_kubernetes_examples()
@@ -1,13 +1,20 @@
 """Pytest configuration and fixtures for TrueNAS MCP Server tests."""
 
 import asyncio
-from typing import AsyncGenerator, Dict, Any
-from unittest.mock import AsyncMock, MagicMock
+import json
+import os
+import socket
+from types import MappingProxyType
+from typing import AsyncGenerator, Callable, Dict, Any, Mapping, Tuple
+from urllib.parse import urlparse
+from unittest.mock import MagicMock
 
 import pytest
+import pytest_asyncio
 import httpx
 from pydantic import SecretStr
 
+from truenas_mcp_server.cache import CacheManager
 from truenas_mcp_server.config.settings import Settings
 from truenas_mcp_server.client.http_client import TrueNASClient
 
@@ -17,12 +24,53 @@ from truenas_mcp_server.client.http_client import TrueNASClient
 # ============================================================================
 
 
+def pytest_addoption(parser):
+    """Register the --run-slow command-line option."""
+    parser.addoption(
+        "--run-slow", action="store_true", default=False, help="run tests marked slow"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip slow tests unless --run-slow is given."""
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="needs --run-slow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
 @pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Run async tests on uvloop when it is installed, else the default loop."""
+    try:
+        import uvloop
+    except ImportError:  # uvloop is unavailable on Windows
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
+
+
+@pytest.fixture(scope="session")
+def truenas_reachable() -> bool:
+    """Probe TRUENAS_URL once per session with a 1s TCP connect."""
+    url = os.getenv("TRUENAS_URL")
+    if not url:
+        return False
+    parsed = urlparse(url)
+    port = parsed.port or (443 if parsed.scheme == "https" else 80)
+    try:
+        socket.create_connection((parsed.hostname, port), timeout=1.0).close()
+        return True
+    except OSError:
+        return False
+
+
+@pytest.fixture
+def require_truenas(truenas_reachable: bool) -> None:
+    """Skip tests that need a live TrueNAS when none is reachable."""
+    if not truenas_reachable:
+        pytest.skip("No TrueNAS host reachable at TRUENAS_URL")
 
 
 # ============================================================================
@@ -30,25 +78,30 @@ def event_loop():
 # ============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_settings() -> Settings:
-    """Create mock settings for testing."""
+    """Create mock settings for testing.
+
+    Shared across the session; tests that need different values should use
+    ``mock_settings.model_copy(update=...)`` rather than assigning fields.
+    Caching is off so results never leak between tests.
+    """
     return Settings(
         truenas_url="https://truenas.local",
         truenas_api_key=SecretStr("test-api-key-1234567890"),
         truenas_verify_ssl=False,
-        environment="testing",
+        environment="development",
         log_level="DEBUG",
         enable_destructive_operations=True,
+        enable_cache=False,
         http_timeout=30.0,
         http_pool_connections=10,
         http_pool_maxsize=20,
         http_max_retries=3,
-        http_retry_backoff_factor=2.0,
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def production_settings() -> Settings:
     """Create production-like settings for testing."""
     return Settings(
@@ -67,36 +120,131 @@ def production_settings() -> Settings:
 # ============================================================================
 
 
-@pytest.fixture
-def mock_httpx_client() -> MagicMock:
-    """Create a mock httpx.AsyncClient."""
-    client = MagicMock(spec=httpx.AsyncClient)
-    client.is_closed = False
-    return client
+class _StubAsyncClient:
+    """Minimal stand-in for httpx.AsyncClient.
+
+    Cheaper to build than a spec'd MagicMock. Tests that need to script or
+    assert on a method replace it with an AsyncMock themselves.
+    """
+
+    is_closed = False
+
+    async def _unexpected(self, *args, **kwargs):
+        raise AssertionError("Unexpected HTTP call on stub client; patch the method in the test")
+
+    get = post = put = delete = request = _unexpected
+
+    async def aclose(self):
+        self.is_closed = True
 
 
 @pytest.fixture
+def mock_httpx_client() -> _StubAsyncClient:
+    """Create a stub httpx.AsyncClient."""
+    return _StubAsyncClient()
+
+
+@pytest_asyncio.fixture
 async def mock_truenas_client(mock_settings: Settings) -> AsyncGenerator[TrueNASClient, None]:
     """Create a mock TrueNAS HTTP client."""
     client = TrueNASClient(settings=mock_settings)
     # Don't actually connect
-    client._client = AsyncMock(spec=httpx.AsyncClient)
-    client._client.is_closed = False
+    client._client = _StubAsyncClient()
     yield client
     # Clean up
     if not client._client.is_closed:
         await client.close()
 
 
+_JSON_HEADERS = {"content-type": "application/json"}
+
+
+def _json_response(status_code: int, content: bytes) -> httpx.Response:
+    """Build a JSON response that the client reads like a network response.
+
+    Passing the body as a stream (rather than ``content=``) leaves it unread,
+    so httpx records ``elapsed`` when the client consumes it.
+    """
+    return httpx.Response(status_code, stream=httpx.ByteStream(content), headers=_JSON_HEADERS)
+
+
+def _canned(status_code: int, payload: Any) -> Callable[[httpx.Request], httpx.Response]:
+    """Build a route that replies with a pre-encoded JSON body."""
+    content = json.dumps(payload).encode()
+    return lambda request: _json_response(status_code, content)
+
+
+def _echo(request: httpx.Request) -> httpx.Response:
+    """Reply with the headers and JSON body the client actually sent."""
+    body = json.loads(request.content) if request.content else None
+    return _json_response(200, json.dumps({"headers": dict(request.headers), "body": body}).encode())
+
+
+@pytest.fixture(scope="module")
+def mock_transport(mock_pool_response) -> httpx.MockTransport:
+    """Create an httpx.MockTransport serving canned TrueNAS API responses.
+
+    Routes are keyed by (method, path); /status/<code> returns that error.
+    """
+    routes = {
+        ("GET", "/api/v2.0/pool"): _canned(200, _thaw(mock_pool_response)),
+        ("GET", "/api/v2.0/status/400"): _canned(400, {"message": "Bad request"}),
+        ("GET", "/api/v2.0/status/401"): _canned(401, {"message": "Invalid API key"}),
+        ("GET", "/api/v2.0/status/403"): _canned(403, {"message": "Forbidden"}),
+        ("GET", "/api/v2.0/status/429"): _canned(429, {"message": "Rate limit exceeded"}),
+        ("GET", "/api/v2.0/status/500"): _canned(500, {"message": "Internal Server Error"}),
+        ("GET", "/api/v2.0/echo"): _echo,
+        ("POST", "/api/v2.0/echo"): _echo,
+    }
+    not_found = _canned(404, {"message": "Not found"})
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return routes.get((request.method, request.url.path), not_found)(request)
+
+    return httpx.MockTransport(handler)
+
+
+@pytest_asyncio.fixture
+async def transport_client(
+    mock_settings: Settings, mock_transport: httpx.MockTransport
+) -> AsyncGenerator[TrueNASClient, None]:
+    """Create a real TrueNAS HTTP client wired to the mock transport."""
+    client = TrueNASClient(settings=mock_settings, transport=mock_transport)
+    yield client
+    await client.close()
+
+
 # ============================================================================
 # API Response Fixtures
 # ============================================================================
 
 
-@pytest.fixture
-def mock_pool_response() -> Dict[str, Any]:
+def _freeze(value: Any) -> Any:
+    """Recursively turn dicts into read-only mappings and lists into tuples.
+
+    Response fixtures are shared across the session, so freezing them makes an
+    accidental mutation in one test fail loudly instead of leaking into others.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Return a plain, mutable (and JSON-serializable) copy of a frozen fixture."""
+    if isinstance(value, Mapping):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
+
+
+@pytest.fixture(scope="session")
+def mock_pool_response() -> Tuple[Mapping[str, Any], ...]:
     """Mock response for pool list API."""
-    return [
+    return _freeze([
         {
             "id": 1,
             "name": "tank",
@@ -119,13 +267,13 @@ def mock_pool_response() -> Dict[str, Any]:
                 ],
             },
         }
-    ]
+    ])
 
 
-@pytest.fixture
-def mock_dataset_response() -> Dict[str, Any]:
+@pytest.fixture(scope="session")
+def mock_dataset_response() -> Tuple[Mapping[str, Any], ...]:
     """Mock response for dataset list API."""
-    return [
+    return _freeze([
         {
             "id": "tank/data",
             "name": "data",
@@ -140,13 +288,13 @@ def mock_dataset_response() -> Dict[str, Any]:
             "quota": {"parsed": None},
             "reservation": {"parsed": None},
         }
-    ]
+    ])
 
 
-@pytest.fixture
-def mock_user_response() -> Dict[str, Any]:
+@pytest.fixture(scope="session")
+def mock_user_response() -> Tuple[Mapping[str, Any], ...]:
     """Mock response for user list API."""
-    return [
+    return _freeze([
         {
             "id": 1000,
             "uid": 1000,
@@ -161,13 +309,13 @@ def mock_user_response() -> Dict[str, Any]:
             "group": {"id": 1000, "bsdgrp_gid": 1000, "bsdgrp_group": "testuser"},
             "groups": [1000],
         }
-    ]
+    ])
 
 
-@pytest.fixture
-def mock_snapshot_response() -> Dict[str, Any]:
+@pytest.fixture(scope="session")
+def mock_snapshot_response() -> Tuple[Mapping[str, Any], ...]:
     """Mock response for snapshot list API."""
-    return [
+    return _freeze([
         {
             "id": "tank/data@auto-2024-01-01-00-00",
             "name": "auto-2024-01-01-00-00",
@@ -178,13 +326,13 @@ def mock_snapshot_response() -> Dict[str, Any]:
                 "creation": {"parsed": "2024-01-01T00:00:00"},
             },
         }
-    ]
+    ])
 
 
-@pytest.fixture
-def mock_smb_share_response() -> Dict[str, Any]:
+@pytest.fixture(scope="session")
+def mock_smb_share_response() -> Tuple[Mapping[str, Any], ...]:
     """Mock response for SMB share list API."""
-    return [
+    return _freeze([
         {
             "id": 1,
             "path": "/mnt/tank/data",
@@ -198,7 +346,7 @@ def mock_smb_share_response() -> Dict[str, Any]:
             "hostsallow": [],
             "hostsdeny": [],
         }
-    ]
+    ])
 
 
 # ============================================================================
@@ -206,29 +354,46 @@ def mock_smb_share_response() -> Dict[str, Any]:
 # ============================================================================
 
 
+_RATE_LIMIT_HEADERS = {
+    "content-type": "application/json",
+    "X-RateLimit-Limit": "100",
+    "X-RateLimit-Remaining": "0",
+    "X-RateLimit-Reset": "1704067200",
+}
+
+# body_key -> (JSON payload, headers, raise_for_status message or None)
+_RESPONSE_BODIES: Dict[str, Tuple[Dict[str, Any], Dict[str, str], Any]] = {
+    "success": ({"status": "success"}, _JSON_HEADERS, None),
+    "server_error": ({"error": "Internal Server Error"}, _JSON_HEADERS, "500 Internal Server Error"),
+    "rate_limit": ({"error": "Rate limit exceeded"}, _RATE_LIMIT_HEADERS, None),
+}
+
+
+def _mock_response(status_code: int, body_key: str) -> MagicMock:
+    """Build a fresh spec'd response mock, so no state leaks between tests."""
+    payload, headers, error = _RESPONSE_BODIES[body_key]
+    response = MagicMock(spec=httpx.Response)
+    response.status_code = status_code
+    response.headers = dict(headers)
+    response.json.return_value = payload
+    response.text = json.dumps(payload)
+    if error is not None:
+        response.raise_for_status.side_effect = httpx.HTTPStatusError(
+            error, request=MagicMock(), response=response
+        )
+    return response
+
+
 @pytest.fixture
 def mock_http_response() -> MagicMock:
     """Create a mock HTTP response."""
-    response = MagicMock(spec=httpx.Response)
-    response.status_code = 200
-    response.headers = {"content-type": "application/json"}
-    response.json.return_value = {"status": "success"}
-    response.text = '{"status": "success"}'
-    return response
+    return _mock_response(200, "success")
 
 
 @pytest.fixture
 def mock_error_response() -> MagicMock:
     """Create a mock error HTTP response."""
-    response = MagicMock(spec=httpx.Response)
-    response.status_code = 500
-    response.headers = {"content-type": "application/json"}
-    response.json.return_value = {"error": "Internal Server Error"}
-    response.text = '{"error": "Internal Server Error"}'
-    response.raise_for_status.side_effect = httpx.HTTPStatusError(
-        "500 Internal Server Error", request=MagicMock(), response=response
-    )
-    return response
+    return _mock_response(500, "server_error")
 
 
 # ============================================================================
@@ -236,6 +401,31 @@ def mock_error_response() -> MagicMock:
 # ============================================================================
 
 
+@pytest.fixture
+def make_tools(mock_settings: Settings) -> Callable[..., Any]:
+    """Build an initialized tool instance around a MagicMock client.
+
+    Call it with the tool class; keyword arguments override fields on a copy
+    of mock_settings, e.g. ``make_tools(UserTools, enable_cache=True)``.
+    """
+
+    def _make_tools(tool_class, **settings_overrides):
+        settings = mock_settings.model_copy(update=settings_overrides)
+        tools = tool_class(client=MagicMock(), settings=settings)
+        tools._initialized = True
+        return tools
+
+    return _make_tools
+
+
+@pytest.fixture
+def cache_manager(monkeypatch) -> CacheManager:
+    """Swap the global cache manager for an empty one for this test."""
+    manager = CacheManager(max_size=100, default_ttl=300)
+    monkeypatch.setattr("truenas_mcp_server.cache.decorators.get_cache_manager", lambda: manager)
+    return manager
+
+
 @pytest.fixture
 def mock_tool_arguments() -> Dict[str, Any]:
     """Common tool arguments for testing."""
@@ -286,14 +476,4 @@ def mock_timeout_error() -> httpx.TimeoutException:
 @pytest.fixture
 def mock_rate_limit_response() -> MagicMock:
     """Create a mock rate limit response."""
-    response = MagicMock(spec=httpx.Response)
-    response.status_code = 429
-    response.headers = {
-        "content-type": "application/json",
-        "X-RateLimit-Limit": "100",
-        "X-RateLimit-Remaining": "0",
-        "X-RateLimit-Reset": "1704067200",
-    }
-    response.json.return_value = {"error": "Rate limit exceeded"}
-    response.text = '{"error": "Rate limit exceeded"}'
-    return response
+    return _mock_response(429, "rate_limit")
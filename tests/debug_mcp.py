@@ -8,16 +8,29 @@ from mcp.server.fastmcp import FastMCP
 # Initialize the MCP server
 mcp = FastMCP("TrueNAS Debug")
 
+# The environment does not change for the life of the server, so read it once
+_ENV_SNAPSHOT = dict(os.environ)
+# Sorted and capped so the response stays small on hosts with large environments
+_MAX_ENV_KEYS = 64
+_ENV_KEYS = tuple(sorted(_ENV_SNAPSHOT)[:_MAX_ENV_KEYS])
+_API_KEY = _ENV_SNAPSHOT.get("TRUENAS_API_KEY")
+# Only the last four characters, as in debug_connection; short keys are fully masked
+if not _API_KEY:
+    _API_KEY_PREVIEW = "NOT SET"
+else:
+    _API_KEY_PREVIEW = f"...{_API_KEY[-4:]}" if len(_API_KEY) > 12 else "***"
+
 @mcp.tool()
 async def debug_env() -> Dict[str, Any]:
     """Debug function to check environment variables"""
     return {
-        "TRUENAS_URL": os.getenv("TRUENAS_URL", "NOT SET"),
-        "TRUENAS_API_KEY": os.getenv("TRUENAS_API_KEY", "NOT SET")[:20] + "..." if os.getenv("TRUENAS_API_KEY") else "NOT SET",
-        "TRUENAS_VERIFY_SSL": os.getenv("TRUENAS_VERIFY_SSL", "NOT SET"),
-        "PATH": os.getenv("PATH", "NOT SET"),
-        "PWD": os.getenv("PWD", "NOT SET"),
-        "All ENV vars": list(os.environ.keys())
+        "TRUENAS_URL": _ENV_SNAPSHOT.get("TRUENAS_URL", "NOT SET"),
+        "TRUENAS_API_KEY": _API_KEY_PREVIEW,
+        "TRUENAS_VERIFY_SSL": _ENV_SNAPSHOT.get("TRUENAS_VERIFY_SSL", "NOT SET"),
+        "PATH": _ENV_SNAPSHOT.get("PATH", "NOT SET"),
+        "PWD": _ENV_SNAPSHOT.get("PWD", "NOT SET"),
+        f"First {_MAX_ENV_KEYS} ENV var names": _ENV_KEYS,
+        "ENV var count": len(_ENV_SNAPSHOT)
     }
 
 if __name__ == "__main__":
@@ -0,0 +1,21 @@
+"""Shared fixtures for integration tests."""
+
+from typing import Any, Callable
+
+import pytest
+
+from truenas_mcp_server.config.settings import Settings
+from truenas_mcp_server.tools.storage import StorageTools
+from truenas_mcp_server.tools.users import UserTools
+
+
+@pytest.fixture(scope="session")
+def storage_tools_factory(mock_settings: Settings) -> Callable[[Any], StorageTools]:
+    """Build StorageTools around a given client with the shared settings."""
+    return lambda client: StorageTools(client=client, settings=mock_settings)
+
+
+@pytest.fixture(scope="session")
+def user_tools_factory(mock_settings: Settings) -> Callable[[Any], UserTools]:
+    """Build UserTools around a given client with the shared settings."""
+    return lambda client: UserTools(client=client, settings=mock_settings)
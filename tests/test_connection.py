@@ -5,9 +5,26 @@ Test script to verify TrueNAS API connection
 
 import os
 import asyncio
-import httpx
+import importlib.util
+from itertools import islice
+
+import anyio
+import pytest
 from dotenv import load_dotenv
 
+from truenas_mcp_server.client import get_client, close_client
+from truenas_mcp_server.exceptions import TrueNASError
+
+# Keep the listing readable on systems with thousands of accounts
+MAX_LISTED_USERS = 20
+
+# Under pytest this only runs against a reachable host (see require_truenas)
+pytestmark = [
+    pytest.mark.network,
+    pytest.mark.asyncio,
+    pytest.mark.usefixtures("require_truenas"),
+]
+
 async def test_connection():
     # Load environment variables
     load_dotenv()
@@ -23,55 +40,49 @@ async def test_connection():
     print(f"🔍 Testing connection to: {base_url}")
     print(f"🔐 SSL Verification: {verify_ssl}")
     
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json"
-    }
-    
-    async with httpx.AsyncClient(
-        base_url=f"{base_url}/api/v2.0",
-        headers=headers,
-        verify=verify_ssl,
-        timeout=30.0
-    ) as client:
-        try:
-            # Test system info endpoint
-            print("\n📊 Testing system info endpoint...")
-            response = await client.get("/system/info")
-            response.raise_for_status()
-            
-            info = response.json()
-            print(f"✅ Connected to: {info.get('hostname', 'Unknown')}")
-            print(f"✅ Version: {info.get('version', 'Unknown')}")
-            
-            # Test user endpoint
-            print("\n👥 Testing user endpoint...")
-            response = await client.get("/user")
-            response.raise_for_status()
-            
-            users = response.json()
-            user_count = len(users)
-            custom_users = [u for u in users if not u.get('builtin', True)]
-            
-            print(f"✅ Found {user_count} total users")
-            print(f"✅ Found {len(custom_users)} custom users")
-            
-            if custom_users:
-                print("\n📋 Custom users:")
-                for user in custom_users:
-                    print(f"   - {user.get('username')} ({user.get('full_name', 'No name')})")
-            
-            print("\n✨ Connection test successful!")
-            
-        except httpx.HTTPError as e:
-            print(f"\n❌ Connection failed: {e}")
-            if hasattr(e, 'response') and e.response:
-                print(f"   Status: {e.response.status_code}")
-                print(f"   Details: {e.response.text}")
-        except Exception as e:
-            print(f"\n❌ Unexpected error: {e}")
+    # Reuse the server's pooled client so both probes share one handshake
+    client = await get_client()
+    try:
+        # Both probes are independent, so keep them in flight together
+        print("\n📊 Testing system info and user endpoints...")
+        info, users = await asyncio.gather(
+            client.get("/system/info"),
+            client.get("/user")
+        )
+        
+        print(f"✅ Connected to: {info.get('hostname', 'Unknown')}")
+        print(f"✅ Version: {info.get('version', 'Unknown')}")
+        
+        # Test user endpoint
+        print("\n👥 User endpoint results...")
+        user_count = len(users)
+        custom_count = sum(1 for u in users if not u.get('builtin', True))
+        
+        print(f"✅ Found {user_count} total users")
+        print(f"✅ Found {custom_count} custom users")
+        
+        if custom_count:
+            print("\n📋 Custom users:")
+            custom_users = (u for u in users if not u.get('builtin', True))
+            for user in islice(custom_users, MAX_LISTED_USERS):
+                print(f"   - {user.get('username')} ({user.get('full_name', 'No name')})")
+            if custom_count > MAX_LISTED_USERS:
+                print(f"   ... and {custom_count - MAX_LISTED_USERS} more")
+        
+        print("\n✨ Connection test successful!")
+        
+    except TrueNASError as e:
+        print(f"\n❌ Connection failed: {e}")
+    except Exception as e:
+        print(f"\n❌ Unexpected error: {e}")
+    finally:
+        await close_client()
 
 if __name__ == "__main__":
     print("🚀 TrueNAS Core MCP Server - Connection Test")
     print("=" * 50)
-    asyncio.run(test_connection())
+    anyio.run(
+        test_connection,
+        backend="asyncio",
+        backend_options={"use_uvloop": importlib.util.find_spec("uvloop") is not None},
+    )
@@ -63,6 +63,29 @@ def test_import_config():
     assert Settings is not None
 
 
+def _registered_tool_names():
+    """Collect the names of all tools the tool classes register"""
+    from truenas_mcp_server import tools
+    names = set()
+    for cls_name in tools.__all__:
+        cls = getattr(tools, cls_name)
+        if isinstance(cls, type) and issubclass(cls, tools.BaseTool) and cls is not tools.BaseTool:
+            names.update(definition[0] for definition in cls().get_tool_definitions())
+    return frozenset(names)
+
+
+@pytest.mark.parametrize("name", [
+    "list_users",
+    "list_pools",
+    "list_datasets",
+    "create_dataset",
+    "create_nfs_export",
+])
+def test_function_available(name):
+    """Test that core tools are registered"""
+    assert name in _registered_tool_names()
+
+
 if __name__ == "__main__":
     # Run basic import test
     test_import_main_package()
@@ -5,13 +5,28 @@ Test script for TrueNAS MCP Server Phase 2 features
 
 import os
 import asyncio
+import importlib.util
+
+import anyio
 import httpx
+import pytest
 from dotenv import load_dotenv
 
+# Read .env once at import; the conftest reachability probe needs it too
+load_dotenv()
+
+# Live test: skipped quickly when no TrueNAS answers at TRUENAS_URL
+pytestmark = [pytest.mark.network, pytest.mark.usefixtures("require_truenas")]
+
+def _json(result):
+    """Decode a gathered probe response, re-raising its failure if it had one"""
+    if isinstance(result, BaseException):
+        raise result
+    result.raise_for_status()
+    return result.json()
+
+@pytest.mark.asyncio
 async def test_phase2_features():
-    # Load environment variables
-    load_dotenv()
-    
     base_url = os.getenv("TRUENAS_URL")
     api_key = os.getenv("TRUENAS_API_KEY")
     verify_ssl = os.getenv("TRUENAS_VERIFY_SSL", "true").lower() == "true"
@@ -27,19 +42,41 @@ async def test_phase2_features():
         "Content-Type": "application/json"
     }
     
+    # Test with a known path
+    test_path = "/mnt"
+    
     async with httpx.AsyncClient(
         base_url=f"{base_url}/api/v2.0",
         headers=headers,
         verify=verify_ssl,
-        timeout=30.0
+        timeout=30.0,
+        http2=True,  # Multiplex the concurrent probes over one TLS connection
+        limits=httpx.Limits(
+            max_connections=10,
+            max_keepalive_connections=20,
+            keepalive_expiry=30.0
+        )
     ) as client:
         
+        # The probes are independent, so issue them together and report in order
+        print("\n📡 Probing Phase 2 endpoints...")
+        (
+            datasets_r, stat_r, nfs_r, targets_r, extents_r, portals_r, tasks_r
+        ) = await asyncio.gather(
+            client.get("/pool/dataset"),
+            client.post("/filesystem/stat", json={"path": test_path}),
+            client.get("/sharing/nfs"),
+            client.get("/iscsi/target"),
+            client.get("/iscsi/extent"),
+            client.get("/iscsi/portal"),
+            client.get("/pool/snapshottask"),
+            return_exceptions=True
+        )
+        
         # Test dataset properties endpoint
         print("\n📊 Testing dataset properties...")
         try:
-            response = await client.get("/pool/dataset")
-            response.raise_for_status()
-            datasets = response.json()
+            datasets = _json(datasets_r)
             
             if datasets:
                 print(f"✅ Found {len(datasets)} datasets")
@@ -57,11 +94,10 @@ async def test_phase2_features():
         # Test filesystem permissions endpoint
         print("\n🔐 Testing filesystem permissions...")
         try:
-            # Test with a known path
-            test_path = "/mnt"
-            response = await client.post("/filesystem/stat", json={"path": test_path})
-            if response.status_code == 200:
-                stat_info = response.json()
+            if isinstance(stat_r, BaseException):
+                raise stat_r
+            if stat_r.status_code == 200:
+                stat_info = stat_r.json()
                 print(f"✅ Filesystem stat endpoint working")
                 print(f"   Path: {test_path}")
                 print(f"   Mode: {stat_info.get('mode', 'N/A')}")
@@ -75,9 +111,7 @@ async def test_phase2_features():
         # Test NFS sharing endpoint
         print("\n🌐 Testing NFS sharing...")
         try:
-            response = await client.get("/sharing/nfs")
-            response.raise_for_status()
-            nfs_shares = response.json()
+            nfs_shares = _json(nfs_r)
             print(f"✅ Found {len(nfs_shares)} NFS shares")
             
             if nfs_shares:
@@ -91,22 +125,13 @@ async def test_phase2_features():
         # Test iSCSI endpoints
         print("\n💾 Testing iSCSI configuration...")
         try:
-            # Test targets
-            response = await client.get("/iscsi/target")
-            response.raise_for_status()
-            targets = response.json()
+            targets = _json(targets_r)
             print(f"✅ Found {len(targets)} iSCSI targets")
             
-            # Test extents
-            response = await client.get("/iscsi/extent")
-            response.raise_for_status()
-            extents = response.json()
+            extents = _json(extents_r)
             print(f"✅ Found {len(extents)} iSCSI extents")
             
-            # Test portals
-            response = await client.get("/iscsi/portal")
-            response.raise_for_status()
-            portals = response.json()
+            portals = _json(portals_r)
             print(f"✅ Found {len(portals)} iSCSI portals")
         except Exception as e:
             print(f"❌ Failed to test iSCSI: {e}")
@@ -114,9 +139,7 @@ async def test_phase2_features():
         # Test snapshot tasks endpoint
         print("\n📸 Testing snapshot automation...")
         try:
-            response = await client.get("/pool/snapshottask")
-            response.raise_for_status()
-            tasks = response.json()
+            tasks = _json(tasks_r)
             print(f"✅ Found {len(tasks)} snapshot tasks")
             
             if tasks:
@@ -163,5 +186,9 @@ def print_phase2_capabilities():
 if __name__ == "__main__":
     print("🧪 TrueNAS Core MCP Server - Phase 2 Feature Test")
     print("=" * 50)
-    asyncio.run(test_phase2_features())
+    anyio.run(
+        test_phase2_features,
+        backend="asyncio",
+        backend_options={"use_uvloop": importlib.util.find_spec("uvloop") is not None},
+    )
     print_phase2_capabilities()
@@ -0,0 +1,61 @@
+"""
+Smoke tests against a live TrueNAS API
+
+Requires TRUENAS_URL and TRUENAS_API_KEY (environment or .env); skipped otherwise.
+All probes share one module-scoped client, so the TLS handshake happens once.
+"""
+
+import os
+
+import httpx
+import pytest
+import pytest_asyncio
+from dotenv import load_dotenv
+
+load_dotenv()
+
+TRUENAS_URL = os.getenv("TRUENAS_URL", "").strip()
+TRUENAS_API_KEY = os.getenv("TRUENAS_API_KEY", "").strip()
+TRUENAS_VERIFY_SSL = os.getenv("TRUENAS_VERIFY_SSL", "false").lower() == "true"
+
+pytestmark = [
+    pytest.mark.network,
+    pytest.mark.skipif(
+        not (TRUENAS_URL and TRUENAS_API_KEY),
+        reason="TRUENAS_URL and TRUENAS_API_KEY are not configured"
+    ),
+    pytest.mark.usefixtures("require_truenas"),
+]
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def truenas_http():
+    """Shared client for all smoke probes in this module."""
+    async with httpx.AsyncClient(
+        base_url=f"{TRUENAS_URL}/api/v2.0",
+        headers={
+            "Authorization": f"Bearer {TRUENAS_API_KEY}",
+            "Content-Type": "application/json"
+        },
+        verify=TRUENAS_VERIFY_SSL,
+        timeout=10.0
+    ) as client:
+        yield client
+
+
+@pytest.mark.asyncio(loop_scope="module")
+@pytest.mark.parametrize("endpoint", ["/system/info", "/pool", "/pool/dataset"])
+async def test_endpoint_responds(truenas_http, endpoint):
+    """Test that the API key is accepted and the endpoint answers."""
+    response = await truenas_http.get(endpoint)
+    assert response.status_code == 200, response.text[:200]
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_system_info_identifies_host(truenas_http):
+    """Test that system info reports a hostname and version."""
+    response = await truenas_http.get("/system/info")
+    response.raise_for_status()
+    info = response.json()
+    assert info.get("hostname")
+    assert info.get("version")
@@ -11,27 +11,65 @@ Test resources use the 'mcp-test-' prefix to avoid conflicts with production.
 import asyncio
 import os
 import pytest
+import pytest_asyncio
 from typing import Optional
 
 # Skip all tests if not configured
-pytestmark = pytest.mark.skipif(
-    not os.environ.get("TRUENAS_URL"),
-    reason="TRUENAS_URL not set - skipping live tests"
-)
+pytestmark = [
+    pytest.mark.network,
+    pytest.mark.slow,
+    pytest.mark.asyncio(loop_scope="module"),
+    pytest.mark.skipif(
+        not os.environ.get("TRUENAS_URL"),
+        reason="TRUENAS_URL not set - skipping live tests"
+    ),
+]
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def truenas_client():
+    """One connected client shared by every live test in this module"""
+    from truenas_mcp_server.client.http_client import TrueNASClient
+    async with TrueNASClient() as client:
+        yield client
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def negative_probe_results(truenas_client):
+    """Look up one missing app, instance and VM concurrently, once per module"""
+    from truenas_mcp_server.tools.apps import AppTools
+    from truenas_mcp_server.tools.instances import InstanceTools
+    from truenas_mcp_server.tools.vms import LegacyVMTools
+
+    app, instance, vm = await asyncio.gather(
+        AppTools(client=truenas_client).get_app("nonexistent-app-xyz123"),
+        InstanceTools(client=truenas_client).get_instance("nonexistent-instance-xyz123"),
+        LegacyVMTools(client=truenas_client).get_legacy_vm(99999),
+    )
+    return {"app": app, "instance": instance, "vm": vm}
 
 
 class TestAppToolsLive:
     """Live tests for AppTools"""
 
-    @pytest.fixture
-    def app_tools(self):
+    @pytest.fixture(scope="class")
+    def app_tools(self, truenas_client):
         from truenas_mcp_server.tools.apps import AppTools
-        return AppTools()
+        return AppTools(client=truenas_client)
 
-    @pytest.mark.asyncio
-    async def test_list_apps(self, app_tools):
+    @pytest_asyncio.fixture(scope="class", loop_scope="module")
+    async def apps_list(self, app_tools):
+        return await app_tools.list_apps()
+
+    @pytest.fixture(scope="class")
+    def app_name(self, apps_list):
+        if not apps_list.get("apps"):
+            pytest.skip("No apps found to test")
+        return apps_list["apps"][0]["name"]
+
+    async def test_list_apps(self, apps_list):
         """Test listing all apps (read-only, safe)"""
-        result = await app_tools.list_apps()
+        result = apps_list
         assert result["success"] is True
         assert "apps" in result
         assert "metadata" in result
@@ -39,37 +77,23 @@ class TestAppToolsLive:
         for app in result["apps"]:
             print(f"  - {app['name']}: {app['state']}")
 
-    @pytest.mark.asyncio
-    async def test_get_app_existing(self, app_tools):
+    async def test_get_app_existing(self, app_tools, app_name):
         """Test getting an existing app"""
-        # First list apps to find one
-        list_result = await app_tools.list_apps()
-        if not list_result["apps"]:
-            pytest.skip("No apps found to test")
-
-        app_name = list_result["apps"][0]["name"]
         result = await app_tools.get_app(app_name)
         assert result["success"] is True
         assert result["app"]["name"] == app_name
 
-    @pytest.mark.asyncio
-    async def test_get_app_config_existing(self, app_tools):
+    async def test_get_app_config_existing(self, app_tools, app_name):
         """Test getting app config (uses quirky plain string body!)"""
-        list_result = await app_tools.list_apps()
-        if not list_result["apps"]:
-            pytest.skip("No apps found to test")
-
-        app_name = list_result["apps"][0]["name"]
         result = await app_tools.get_app_config(app_name)
         assert result["success"] is True
         assert result["app_name"] == app_name
         assert "config" in result
         print(f"\nApp {app_name} config keys: {list(result['config'].keys()) if result['config'] else 'empty'}")
 
-    @pytest.mark.asyncio
-    async def test_get_app_nonexistent(self, app_tools):
+    async def test_get_app_nonexistent(self, negative_probe_results):
         """Test getting a non-existent app"""
-        result = await app_tools.get_app("nonexistent-app-xyz123")
+        result = negative_probe_results["app"]
         assert result["success"] is False
         assert "not found" in result["error"].lower()
 
@@ -77,15 +101,24 @@ class TestAppToolsLive:
 class TestInstanceToolsLive:
     """Live tests for InstanceTools"""
 
-    @pytest.fixture
-    def instance_tools(self):
+    @pytest.fixture(scope="class")
+    def instance_tools(self, truenas_client):
         from truenas_mcp_server.tools.instances import InstanceTools
-        return InstanceTools()
+        return InstanceTools(client=truenas_client)
+
+    @pytest_asyncio.fixture(scope="class", loop_scope="module")
+    async def instances_list(self, instance_tools):
+        return await instance_tools.list_instances()
+
+    @pytest.fixture(scope="class")
+    def instance_name(self, instances_list):
+        if not instances_list.get("instances"):
+            pytest.skip("No instances found to test")
+        return instances_list["instances"][0]["name"]
 
-    @pytest.mark.asyncio
-    async def test_list_instances(self, instance_tools):
+    async def test_list_instances(self, instances_list):
         """Test listing all Incus instances (read-only, safe)"""
-        result = await instance_tools.list_instances()
+        result = instances_list
         assert result["success"] is True
         assert "instances" in result
         assert "metadata" in result
@@ -93,7 +126,6 @@ class TestInstanceToolsLive:
         for inst in result["instances"]:
             print(f"  - {inst['name']} ({inst['type']}): {inst['status']} - {inst['cpu']} CPU, {inst['memory_gb']}GB RAM")
 
-    @pytest.mark.asyncio
     async def test_list_instances_filter_vm(self, instance_tools):
         """Test filtering instances by type"""
         result = await instance_tools.list_instances(instance_type="VM")
@@ -101,7 +133,6 @@ class TestInstanceToolsLive:
         for inst in result["instances"]:
             assert inst["type"] == "VM"
 
-    @pytest.mark.asyncio
     async def test_list_instances_filter_container(self, instance_tools):
         """Test filtering instances by type"""
         result = await instance_tools.list_instances(instance_type="CONTAINER")
@@ -109,51 +140,47 @@ class TestInstanceToolsLive:
         for inst in result["instances"]:
             assert inst["type"] == "CONTAINER"
 
-    @pytest.mark.asyncio
-    async def test_get_instance_existing(self, instance_tools):
+    async def test_get_instance_existing(self, instance_tools, instance_name):
         """Test getting an existing instance"""
-        list_result = await instance_tools.list_instances()
-        if not list_result["instances"]:
-            pytest.skip("No instances found to test")
-
-        inst_name = list_result["instances"][0]["name"]
-        result = await instance_tools.get_instance(inst_name)
+        result = await instance_tools.get_instance(instance_name)
         assert result["success"] is True
-        assert result["instance"]["name"] == inst_name
+        assert result["instance"]["name"] == instance_name
 
-    @pytest.mark.asyncio
-    async def test_get_instance_nonexistent(self, instance_tools):
+    async def test_get_instance_nonexistent(self, negative_probe_results):
         """Test getting a non-existent instance"""
-        result = await instance_tools.get_instance("nonexistent-instance-xyz123")
+        result = negative_probe_results["instance"]
         assert result["success"] is False
         assert "not found" in result["error"].lower()
 
-    @pytest.mark.asyncio
-    async def test_list_instance_devices(self, instance_tools):
+    async def test_list_instance_devices(self, instance_tools, instance_name):
         """Test listing devices for an instance"""
-        list_result = await instance_tools.list_instances()
-        if not list_result["instances"]:
-            pytest.skip("No instances found to test")
-
-        inst_name = list_result["instances"][0]["name"]
-        result = await instance_tools.list_instance_devices(inst_name)
+        result = await instance_tools.list_instance_devices(instance_name)
         assert result["success"] is True
         assert "devices" in result
-        print(f"\nInstance {inst_name} has {result['metadata']['device_count']} devices")
+        print(f"\nInstance {instance_name} has {result['metadata']['device_count']} devices")
 
 
 class TestLegacyVMToolsLive:
     """Live tests for LegacyVMTools"""
 
-    @pytest.fixture
-    def vm_tools(self):
+    @pytest.fixture(scope="class")
+    def vm_tools(self, truenas_client):
         from truenas_mcp_server.tools.vms import LegacyVMTools
-        return LegacyVMTools()
+        return LegacyVMTools(client=truenas_client)
+
+    @pytest_asyncio.fixture(scope="class", loop_scope="module")
+    async def vms_list(self, vm_tools):
+        return await vm_tools.list_legacy_vms()
 
-    @pytest.mark.asyncio
-    async def test_list_legacy_vms(self, vm_tools):
+    @pytest.fixture(scope="class")
+    def vm_id(self, vms_list):
+        if not vms_list.get("vms"):
+            pytest.skip("No legacy VMs found to test")
+        return vms_list["vms"][0]["id"]
+
+    async def test_list_legacy_vms(self, vms_list):
         """Test listing all legacy VMs (read-only, safe)"""
-        result = await vm_tools.list_legacy_vms()
+        result = vms_list
         assert result["success"] is True
         assert "vms" in result
         assert "metadata" in result
@@ -161,22 +188,15 @@ class TestLegacyVMToolsLive:
         for vm in result["vms"]:
             print(f"  - {vm['name']} (ID: {vm['id']}): {vm['status']} - {vm['vcpus']} vCPU, {vm['memory_mb']}MB RAM")
 
-    @pytest.mark.asyncio
-    async def test_get_legacy_vm_existing(self, vm_tools):
+    async def test_get_legacy_vm_existing(self, vm_tools, vm_id):
         """Test getting an existing legacy VM"""
-        list_result = await vm_tools.list_legacy_vms()
-        if not list_result["vms"]:
-            pytest.skip("No legacy VMs found to test")
-
-        vm_id = list_result["vms"][0]["id"]
         result = await vm_tools.get_legacy_vm(vm_id)
         assert result["success"] is True
         assert result["vm"]["id"] == vm_id
 
-    @pytest.mark.asyncio
-    async def test_get_legacy_vm_nonexistent(self, vm_tools):
+    async def test_get_legacy_vm_nonexistent(self, negative_probe_results):
         """Test getting a non-existent legacy VM"""
-        result = await vm_tools.get_legacy_vm(99999)
+        result = negative_probe_results["vm"]
         assert result["success"] is False
         assert "not found" in result["error"].lower()
 
@@ -184,8 +204,7 @@ class TestLegacyVMToolsLive:
 class TestIntegration:
     """Integration tests that exercise multiple tools together"""
 
-    @pytest.mark.asyncio
-    async def test_full_workflow(self):
+    async def test_full_workflow(self, truenas_client):
         """
         Test a full workflow:
         1. List resources
@@ -196,14 +215,17 @@ class TestIntegration:
         from truenas_mcp_server.tools.instances import InstanceTools
         from truenas_mcp_server.tools.vms import LegacyVMTools
 
-        app_tools = AppTools()
-        instance_tools = InstanceTools()
-        vm_tools = LegacyVMTools()
+        # Share one client so the requests overlap on a single connection pool
+        app_tools = AppTools(client=truenas_client)
+        instance_tools = InstanceTools(client=truenas_client)
+        vm_tools = LegacyVMTools(client=truenas_client)
 
-        # List all resource types
-        apps = await app_tools.list_apps()
-        instances = await instance_tools.list_instances()
-        vms = await vm_tools.list_legacy_vms()
+        # List all resource types concurrently
+        apps, instances, vms = await asyncio.gather(
+            app_tools.list_apps(),
+            instance_tools.list_instances(),
+            vm_tools.list_legacy_vms(),
+        )
 
         print("\n=== TrueNAS Virtualization Summary ===")
         print(f"Apps: {apps['metadata']['total_apps']}")
@@ -219,25 +241,30 @@ class TestIntegration:
 if __name__ == "__main__":
     # Run quick smoke test
     async def smoke_test():
+        from truenas_mcp_server.client import get_client
         from truenas_mcp_server.tools.apps import AppTools
         from truenas_mcp_server.tools.instances import InstanceTools
         from truenas_mcp_server.tools.vms import LegacyVMTools
 
-        print("Testing AppTools...")
-        app_tools = AppTools()
-        apps = await app_tools.list_apps()
+        print("Testing AppTools, InstanceTools and LegacyVMTools...")
+        client = await get_client()
+        apps, instances, vms = await asyncio.gather(
+            AppTools(client=client).list_apps(),
+            InstanceTools(client=client).list_instances(),
+            LegacyVMTools(client=client).list_legacy_vms(),
+        )
         print(f"  Found {apps['metadata']['total_apps']} apps")
-
-        print("Testing InstanceTools...")
-        instance_tools = InstanceTools()
-        instances = await instance_tools.list_instances()
         print(f"  Found {instances['metadata']['total_instances']} instances")
-
-        print("Testing LegacyVMTools...")
-        vm_tools = LegacyVMTools()
-        vms = await vm_tools.list_legacy_vms()
         print(f"  Found {vms['metadata']['total_vms']} legacy VMs")
 
         print("\nAll smoke tests passed!")
 
-    asyncio.run(smoke_test())
+    import importlib.util
+
+    import anyio
+
+    anyio.run(
+        smoke_test,
+        backend="asyncio",
+        backend_options={"use_uvloop": importlib.util.find_spec("uvloop") is not None},
+    )
@@ -1,9 +1,15 @@
 """Unit tests for HTTP client."""
 
+import asyncio
+import json
+from contextlib import aclosing
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 import httpx
 
+from truenas_mcp_server.client import http_client
+
 from truenas_mcp_server.client.http_client import TrueNASClient
 from truenas_mcp_server.exceptions import (
     TrueNASConnectionError,
@@ -12,6 +18,13 @@ from truenas_mcp_server.exceptions import (
     TrueNASTimeoutError,
     TrueNASRateLimitError,
 )
+from tests.conftest import _json_response, _thaw
+
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    """Skip the retry decorator's backoff sleeps."""
+    monkeypatch.setattr("truenas_mcp_server.client.http_client.asyncio.sleep", AsyncMock())
 
 
 class TestTrueNASHTTPClient:
@@ -25,216 +38,216 @@ class TestTrueNASHTTPClient:
         assert client._client is None
 
     @pytest.mark.asyncio
-    async def test_get_headers(self, mock_settings):
+    async def test_get_headers(self, mock_settings, transport_client):
         """Test authentication headers are properly set."""
-        client = TrueNASClient(settings=mock_settings)
-        headers = client._get_headers()
+        result = await transport_client.get("/echo")
 
-        assert "Authorization" in headers
-        assert headers["Authorization"] == f"Bearer {mock_settings.truenas_api_key.get_secret_value()}"
-        assert headers["Content-Type"] == "application/json"
+        headers = result["headers"]
+        assert headers["authorization"] == f"Bearer {mock_settings.truenas_api_key.get_secret_value()}"
+        assert headers["content-type"] == "application/json"
 
     @pytest.mark.asyncio
-    async def test_successful_get_request(self, mock_settings, mock_pool_response):
+    async def test_successful_get_request(self, transport_client, mock_pool_response):
         """Test successful GET request."""
-        client = TrueNASClient(settings=mock_settings)
+        result = await transport_client.get("/pool")
 
-        # Mock the httpx client
-        mock_response = MagicMock(spec=httpx.Response)
-        mock_response.status_code = 200
-        mock_response.json.return_value = mock_pool_response
-
-        client._client = AsyncMock(spec=httpx.AsyncClient)
-        client._client.request.return_value = mock_response
-
-        result = await client.request("GET", "/api/v2.0/pool")
-
-        assert result == mock_pool_response
-        client._client.request.assert_called_once()
+        assert result == _thaw(mock_pool_response)
 
     @pytest.mark.asyncio
-    async def test_authentication_error(self, mock_settings):
-        """Test 401 authentication error handling."""
-        client = TrueNASClient(settings=mock_settings)
-
-        mock_response = MagicMock(spec=httpx.Response)
-        mock_response.status_code = 401
-        mock_response.json.return_value = {"error": "Invalid API key"}
-        mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
-            "401 Unauthorized",
-            request=MagicMock(),
-            response=mock_response
-        )
+    async def test_iter_items(self, transport_client, mock_pool_response):
+        """Test streamed array elements match the buffered response."""
+        items = [item async for item in transport_client.iter_items("/pool")]
 
-        client._client = AsyncMock(spec=httpx.AsyncClient)
-        client._client.request.return_value = mock_response
+        assert items == _thaw(mock_pool_response)
 
+    @pytest.mark.asyncio
+    async def test_iter_items_error_status(self, transport_client):
+        """Test streamed requests map error statuses like buffered ones."""
         with pytest.raises(TrueNASAuthenticationError):
-            await client.request("GET", "/api/v2.0/pool")
+            async for _ in transport_client.iter_items("/status/401"):
+                pass
 
     @pytest.mark.asyncio
-    async def test_403_permission_error(self, mock_settings):
-        """Test 403 permission error handling."""
-        client = TrueNASClient(settings=mock_settings)
+    @pytest.mark.parametrize("status_code, error", [
+        (400, TrueNASAPIError),
+        (401, TrueNASAuthenticationError),
+        (403, TrueNASAuthenticationError),
+        (429, TrueNASRateLimitError),
+        (500, TrueNASAPIError),
+    ])
+    async def test_error_status(self, transport_client, status_code, error):
+        """Test error status codes map to TrueNAS exceptions."""
+        with pytest.raises(error) as exc_info:
+            await transport_client.get(f"/status/{status_code}")
+
+        assert exc_info.value.details["status_code"] == status_code
 
-        mock_response = MagicMock(spec=httpx.Response)
-        mock_response.status_code = 403
-        mock_response.json.return_value = {"error": "Forbidden"}
-        mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
-            "403 Forbidden",
-            request=MagicMock(),
-            response=mock_response
-        )
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("transport_error, error", [
+        (httpx.TimeoutException, TrueNASTimeoutError),
+        (httpx.ConnectError, TrueNASConnectionError),
+    ])
+    async def test_transport_error(self, mock_settings, no_backoff, transport_error, error):
+        """Test timeouts and connection failures map to TrueNAS exceptions."""
+        def handler(request):
+            raise transport_error("Request failed", request=request)
 
-        client._client = AsyncMock(spec=httpx.AsyncClient)
-        client._client.request.return_value = mock_response
+        client = TrueNASClient(settings=mock_settings, transport=httpx.MockTransport(handler))
 
-        with pytest.raises(TrueNASAuthenticationError):
-            await client.request("GET", "/api/v2.0/pool")
+        with pytest.raises(error):
+            await client.get("/pool")
 
     @pytest.mark.asyncio
-    async def test_rate_limit_error(self, mock_settings, mock_rate_limit_response):
-        """Test 429 rate limit error handling."""
-        client = TrueNASClient(settings=mock_settings)
+    async def test_post_request_with_data(self, transport_client):
+        """Test POST request with JSON data."""
+        data = {"name": "test", "value": 123}
+        result = await transport_client.post("/echo", data)
 
-        mock_rate_limit_response.raise_for_status.side_effect = httpx.HTTPStatusError(
-            "429 Too Many Requests",
-            request=MagicMock(),
-            response=mock_rate_limit_response
-        )
+        # Verify the request was made with correct data
+        assert result["body"] == data
 
-        client._client = AsyncMock(spec=httpx.AsyncClient)
-        client._client.request.return_value = mock_rate_limit_response
+    @pytest.mark.asyncio
+    async def test_client_context_manager(self, mock_settings, mock_transport):
+        """Test client as async context manager."""
+        async with TrueNASClient(settings=mock_settings, transport=mock_transport) as client:
+            assert client._client is not None
+            assert not client._client.is_closed
 
-        with pytest.raises(TrueNASRateLimitError):
-            await client.request("GET", "/api/v2.0/pool")
+        assert client._client is None
 
     @pytest.mark.asyncio
-    async def test_timeout_error(self, mock_settings):
-        """Test request timeout handling."""
-        client = TrueNASClient(settings=mock_settings)
+    async def test_client_close(self, transport_client):
+        """Test client close functionality."""
+        await transport_client.connect()
+        http_client = transport_client._client
 
-        client._client = AsyncMock(spec=httpx.AsyncClient)
-        client._client.request.side_effect = httpx.TimeoutException("Request timeout")
+        await transport_client.close()
 
-        with pytest.raises(TrueNASTimeoutError):
-            await client.request("GET", "/api/v2.0/pool")
+        assert http_client.is_closed
+        assert transport_client._client is None
 
     @pytest.mark.asyncio
-    async def test_connection_error(self, mock_settings):
-        """Test connection error handling."""
-        client = TrueNASClient(settings=mock_settings)
+    async def test_retry_logic(self, mock_settings, no_backoff):
+        """Test retry logic for transient failures."""
+        # First two calls fail, third succeeds
+        attempts = []
 
-        client._client = AsyncMock(spec=httpx.AsyncClient)
-        client._client.request.side_effect = httpx.ConnectError("Connection refused")
+        def handler(request):
+            attempts.append(request)
+            if len(attempts) < 3:
+                raise httpx.ConnectError("Connection failed", request=request)
+            return _json_response(200, b'{"status": "success"}')
 
-        with pytest.raises(TrueNASConnectionError):
-            await client.request("GET", "/api/v2.0/pool")
+        client = TrueNASClient(settings=mock_settings, transport=httpx.MockTransport(handler))
+
+        # Should succeed after retries
+        result = await client.get("/pool")
+        assert result == {"status": "success"}
+        assert len(attempts) == 3
 
     @pytest.mark.asyncio
-    async def test_generic_http_error(self, mock_settings):
-        """Test generic HTTP error handling."""
-        client = TrueNASClient(settings=mock_settings)
+    async def test_no_retry_on_client_error(self, mock_settings):
+        """Test that client errors (4xx) are not retried."""
+        attempts = []
 
-        mock_response = MagicMock(spec=httpx.Response)
-        mock_response.status_code = 500
-        mock_response.json.return_value = {"error": "Internal Server Error"}
-        mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
-            "500 Internal Server Error",
-            request=MagicMock(),
-            response=mock_response
-        )
+        def handler(request):
+            attempts.append(request)
+            return _json_response(400, b'{"message": "Bad request"}')
 
-        client._client = AsyncMock(spec=httpx.AsyncClient)
-        client._client.request.return_value = mock_response
+        client = TrueNASClient(settings=mock_settings, transport=httpx.MockTransport(handler))
 
         with pytest.raises(TrueNASAPIError):
-            await client.request("GET", "/api/v2.0/pool")
+            await client.get("/pool")
 
-    @pytest.mark.asyncio
-    async def test_post_request_with_data(self, mock_settings):
-        """Test POST request with JSON data."""
-        client = TrueNASClient(settings=mock_settings)
+        # Should only be called once (no retries for 4xx)
+        assert len(attempts) == 1
 
-        mock_response = MagicMock(spec=httpx.Response)
-        mock_response.status_code = 201
-        mock_response.json.return_value = {"id": 1, "name": "test"}
 
-        client._client = AsyncMock(spec=httpx.AsyncClient)
-        client._client.request.return_value = mock_response
+class _ChunkedStream(httpx.AsyncByteStream):
+    """Response body delivered in small chunks, like a slow network read."""
 
-        data = {"name": "test", "value": 123}
-        result = await client.request("POST", "/api/v2.0/test", json=data)
+    def __init__(self, content: bytes, chunk_size: int):
+        self._content = content
+        self._chunk_size = chunk_size
 
-        assert result == {"id": 1, "name": "test"}
+    async def __aiter__(self):
+        for start in range(0, len(self._content), self._chunk_size):
+            yield self._content[start:start + self._chunk_size]
 
-        # Verify the request was made with correct data
-        call_kwargs = client._client.request.call_args[1]
-        assert call_kwargs["json"] == data
+
+async def _chunks(*parts: bytes):
+    for part in parts:
+        yield part
+
+
+class TestAsyncByteReader:
+    """Test the async read() adapter ijson parses from."""
 
     @pytest.mark.asyncio
-    async def test_client_context_manager(self, mock_settings):
-        """Test client as async context manager."""
-        async with TrueNASClient(settings=mock_settings) as client:
-            assert client is not None
-            client._client = AsyncMock(spec=httpx.AsyncClient)
-            client._client.is_closed = False
+    async def test_probe_does_not_consume(self):
+        """Test read(0) returns nothing and leaves the stream untouched."""
+        reader = http_client._AsyncByteReader(_chunks(b"[1,", b"2]"))
+
+        assert await reader.read(0) == b""
+        assert await reader.read() == b"[1,"
 
     @pytest.mark.asyncio
-    async def test_client_close(self, mock_settings):
-        """Test client close functionality."""
-        client = TrueNASClient(settings=mock_settings)
-        client._client = AsyncMock(spec=httpx.AsyncClient)
-        client._client.is_closed = False
+    async def test_sized_reads_honour_size(self):
+        """Test a sized read never returns more than asked for."""
+        reader = http_client._AsyncByteReader(_chunks(b"abcdef", b"gh"))
 
-        await client.close()
+        assert await reader.read(4) == b"abcd"
+        assert await reader.read(4) == b"ef"
+        assert await reader.read(4) == b"gh"
+        assert await reader.read(4) == b""
 
-        client._client.aclose.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_retry_logic(self, mock_settings):
-        """Test retry logic for transient failures."""
-        client = TrueNASClient(settings=mock_settings)
+class TestIterItemsBackends:
+    """Test iter_items with and without ijson."""
 
-        # First two calls fail, third succeeds
-        mock_response_success = MagicMock(spec=httpx.Response)
-        mock_response_success.status_code = 200
-        mock_response_success.json.return_value = {"status": "success"}
+    PAYLOAD = [
+        {"id": i, "name": f"tank/ds{i}", "ratio": 1.5 + i, "tags": ["a", "b"], "quota": None}
+        for i in range(20)
+    ]
 
-        client._client = AsyncMock(spec=httpx.AsyncClient)
-        client._client.request.side_effect = [
-            httpx.ConnectError("Connection failed"),
-            httpx.ConnectError("Connection failed"),
-            mock_response_success
-        ]
+    @pytest.fixture(params=["ijson", "buffered"])
+    def streaming_client(self, request, mock_settings, monkeypatch):
+        """A client whose /pool/dataset body arrives in 7-byte chunks."""
+        if request.param == "ijson":
+            monkeypatch.setattr(http_client, "ijson", pytest.importorskip("ijson"))
+        else:
+            monkeypatch.setattr(http_client, "ijson", None)
 
-        # Should succeed after retries
-        result = await client.request("GET", "/api/v2.0/pool")
-        assert result == {"status": "success"}
-        assert client._client.request.call_count == 3
+        content = json.dumps(self.PAYLOAD).encode()
 
-    @pytest.mark.asyncio
-    async def test_no_retry_on_client_error(self, mock_settings):
-        """Test that client errors (4xx) are not retried."""
-        client = TrueNASClient(settings=mock_settings)
+        def handler(request):
+            return httpx.Response(
+                200,
+                stream=_ChunkedStream(content, 7),
+                headers={"content-type": "application/json"},
+            )
 
-        mock_response = MagicMock(spec=httpx.Response)
-        mock_response.status_code = 400
-        mock_response.json.return_value = {"error": "Bad request"}
-        mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
-            "400 Bad Request",
-            request=MagicMock(),
-            response=mock_response
-        )
+        return TrueNASClient(settings=mock_settings, transport=httpx.MockTransport(handler))
 
-        client._client = AsyncMock(spec=httpx.AsyncClient)
-        client._client.request.return_value = mock_response
+    @pytest.mark.asyncio
+    async def test_items_match_buffered_decode(self, streaming_client):
+        """Test every element decodes exactly as json.loads would."""
+        items = [item async for item in streaming_client.iter_items("/pool/dataset")]
+        await streaming_client.close()
 
-        with pytest.raises(TrueNASAPIError):
-            await client.request("GET", "/api/v2.0/pool")
+        assert items == self.PAYLOAD
+        assert all(type(item["ratio"]) is float for item in items)
 
-        # Should only be called once (no retries for 4xx)
-        assert client._client.request.call_count == 1
+    @pytest.mark.asyncio
+    async def test_early_exit(self, streaming_client):
+        """Test a consumer can stop part-way and the stream is closed."""
+        async with aclosing(streaming_client.iter_items("/pool/dataset")) as items:
+            async for item in items:
+                if item["id"] == 3:
+                    break
+        await streaming_client.close()
+
+        assert item == self.PAYLOAD[3]
 
 
 class TestClientConfiguration:
@@ -252,15 +265,110 @@ class TestClientConfiguration:
         client = TrueNASClient(settings=mock_settings)
         assert mock_settings.truenas_verify_ssl is False
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("verify_ssl", [True, False])
+    async def test_transport_honours_verify_ssl(self, mock_settings, monkeypatch, verify_ssl):
+        """Test the connection pool transport gets the SSL verification setting."""
+        transport = MagicMock(wraps=httpx.AsyncHTTPTransport)
+        monkeypatch.setattr(http_client.httpx, "AsyncHTTPTransport", transport)
+        settings = mock_settings.model_copy(update={"truenas_verify_ssl": verify_ssl})
+
+        client = TrueNASClient(settings=settings)
+        await client.connect()
+        await client.close()
+
+        assert transport.call_args.kwargs["verify"] is verify_ssl
+
     @pytest.mark.asyncio
     async def test_custom_timeout(self, mock_settings):
         """Test custom timeout settings."""
-        mock_settings.http_timeout = 120.0
-        client = TrueNASClient(settings=mock_settings)
-        assert mock_settings.http_timeout == 120.0
+        settings = mock_settings.model_copy(update={"http_timeout": 120.0})
+        client = TrueNASClient(settings=settings)
+        assert client.settings.http_timeout == 120.0
 
     @pytest.mark.asyncio
     async def test_connection_pool_settings(self, mock_settings):
         """Test connection pool configuration."""
         assert mock_settings.http_pool_connections == 10
         assert mock_settings.http_pool_maxsize == 20
+
+
+class TestClientBatch:
+    """Test concurrent batch dispatch."""
+
+    @pytest.mark.asyncio
+    async def test_batch_preserves_order_and_isolates_errors(self, mock_settings):
+        """Test batch returns results in request order and keeps failures per item."""
+        client = TrueNASClient(settings=mock_settings)
+        client.get = AsyncMock(side_effect=[{"hostname": "nas"}, TrueNASAPIError("boom")])
+        client.post = AsyncMock(return_value={"mode": 16877})
+
+        results = await client.batch([
+            {"method": "GET", "url": "/system/info"},
+            {"method": "POST", "url": "/filesystem/stat", "data": {"path": "/mnt"}},
+            {"method": "GET", "url": "/pool"},
+        ])
+
+        assert results[0] == {"hostname": "nas"}
+        assert results[1] == {"mode": 16877}
+        assert isinstance(results[2], TrueNASAPIError)
+        client.post.assert_called_once_with("/filesystem/stat", {"path": "/mnt"})
+
+    @pytest.mark.asyncio
+    async def test_batch_rejects_unknown_method(self, mock_settings):
+        """Test batch refuses methods it cannot dispatch before sending anything."""
+        client = TrueNASClient(settings=mock_settings)
+        client.get = AsyncMock()
+
+        with pytest.raises(ValueError):
+            await client.batch([
+                {"method": "GET", "url": "/system/info"},
+                {"method": "PATCH", "url": "/pool"},
+            ])
+
+        # The valid GET never got as far as creating its coroutine
+        client.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_batch_rejects_missing_url(self, mock_settings):
+        """Test batch refuses a spec without a url before sending anything."""
+        client = TrueNASClient(settings=mock_settings)
+        client.get = AsyncMock()
+
+        with pytest.raises(ValueError):
+            await client.batch([
+                {"method": "GET", "url": "/system/info"},
+                {"method": "GET"},
+            ])
+
+        client.get.assert_not_called()
+
+
+class TestGlobalClient:
+    """Test the shared client accessor."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_first_calls_build_one_client(self, monkeypatch):
+        """Test that racing first calls all get the one client, already connected."""
+        class FakeClient:
+            instances = 0
+
+            def __init__(self):
+                FakeClient.instances += 1
+                self.connected = False
+
+            async def connect(self):
+                await asyncio.sleep(0)
+                self.connected = True
+
+        monkeypatch.setattr(http_client, "TrueNASClient", FakeClient)
+        monkeypatch.setattr(http_client, "_client", None)
+
+        async def get_client():
+            client = await http_client.get_client()
+            return client, client.connected
+
+        results = await asyncio.gather(*(get_client() for _ in range(5)))
+
+        assert FakeClient.instances == 1
+        assert all(client is results[0][0] and connected for client, connected in results)
@@ -1,5 +1,7 @@
 """Unit tests for exception handling."""
 
+from types import MappingProxyType
+
 import pytest
 
 from truenas_mcp_server.exceptions import (
@@ -15,6 +17,32 @@ from truenas_mcp_server.exceptions import (
     TrueNASConfigurationError,
 )
 
+# Read-only details shared by the tests below; built once at import.
+_API_DETAILS = MappingProxyType({"code": 500, "endpoint": "/api/v2/pool"})
+_CONN_DETAILS = MappingProxyType({"host": "truenas.local", "port": 443})
+_AUTH_DETAILS = MappingProxyType({"status_code": 401})
+_BAD_REQUEST_DETAILS = MappingProxyType({
+    "status_code": 400,
+    "response": MappingProxyType({"error": "Invalid dataset name"}),
+})
+_TIMEOUT_DETAILS = MappingProxyType({"timeout": 30.0, "endpoint": "/api/v2/pool"})
+_RATE_LIMIT_DETAILS = MappingProxyType({"limit": 100, "remaining": 0, "reset_time": 1704067200})
+_VALIDATION_DETAILS = MappingProxyType({
+    "fields": ("username", "email"),
+    "errors": ("Username too short", "Invalid email format"),
+})
+_NOT_FOUND_DETAILS = MappingProxyType({"resource": "dataset", "id": "tank/nonexistent"})
+_PERMISSION_DETAILS = MappingProxyType({
+    "operation": "delete_user",
+    "resource": "root",
+    "reason": "Cannot delete system user",
+})
+_CONFIG_DETAILS = MappingProxyType({
+    "setting": "truenas_url",
+    "value": "invalid-url",
+    "reason": "Must be a valid URL",
+})
+
 
 class TestTrueNASError:
     """Test base TrueNAS exception."""
@@ -27,10 +55,9 @@ class TestTrueNASError:
 
     def test_exception_with_details(self):
         """Test exception with details dict."""
-        details = {"code": 500, "endpoint": "/api/v2/pool"}
-        error = TrueNASError("API error", details=details)
+        error = TrueNASError("API error", details=_API_DETAILS)
         assert str(error) == "API error"
-        assert error.details == details
+        assert error.details == _API_DETAILS
         assert error.details["code"] == 500
 
     def test_exception_inheritance(self):
@@ -44,49 +71,27 @@ class TestConnectionError:
 
     def test_connection_error_creation(self):
         """Test connection error with details."""
-        error = TrueNASConnectionError(
-            "Failed to connect",
-            details={"host": "truenas.local", "port": 443}
-        )
+        error = TrueNASConnectionError("Failed to connect", details=_CONN_DETAILS)
         assert "Failed to connect" in str(error)
         assert error.details["host"] == "truenas.local"
 
-    def test_inheritance(self):
-        """Test connection error inherits from base."""
-        error = TrueNASConnectionError("Test")
-        assert isinstance(error, TrueNASError)
-
 
 class TestAuthenticationError:
     """Test authentication error handling."""
 
     def test_auth_error_creation(self):
         """Test authentication error."""
-        error = TrueNASAuthenticationError(
-            "Invalid API key",
-            details={"status_code": 401}
-        )
+        error = TrueNASAuthenticationError("Invalid API key", details=_AUTH_DETAILS)
         assert "Invalid API key" in str(error)
         assert error.details["status_code"] == 401
 
-    def test_inheritance(self):
-        """Test auth error inherits from base."""
-        error = TrueNASAuthenticationError("Test")
-        assert isinstance(error, TrueNASError)
-
 
 class TestAPIError:
     """Test API error handling."""
 
     def test_api_error_with_status_code(self):
         """Test API error with HTTP status code."""
-        error = TrueNASAPIError(
-            "Bad request",
-            details={
-                "status_code": 400,
-                "response": {"error": "Invalid dataset name"}
-            }
-        )
+        error = TrueNASAPIError("Bad request", details=_BAD_REQUEST_DETAILS)
         assert error.details["status_code"] == 400
         assert "Invalid dataset name" in str(error.details["response"]["error"])
 
@@ -101,123 +106,77 @@ class TestTimeoutError:
 
     def test_timeout_error(self):
         """Test timeout error creation."""
-        error = TrueNASTimeoutError(
-            "Request timeout",
-            details={"timeout": 30.0, "endpoint": "/api/v2/pool"}
-        )
+        error = TrueNASTimeoutError("Request timeout", details=_TIMEOUT_DETAILS)
         assert "timeout" in str(error).lower()
         assert error.details["timeout"] == 30.0
 
-    def test_inheritance(self):
-        """Test timeout error inherits from base."""
-        error = TrueNASTimeoutError("Test")
-        assert isinstance(error, TrueNASError)
-
 
 class TestRateLimitError:
     """Test rate limit error handling."""
 
     def test_rate_limit_error(self):
         """Test rate limit error with retry info."""
-        error = TrueNASRateLimitError(
-            "Rate limit exceeded",
-            details={
-                "limit": 100,
-                "remaining": 0,
-                "reset_time": 1704067200
-            }
-        )
+        error = TrueNASRateLimitError("Rate limit exceeded", details=_RATE_LIMIT_DETAILS)
         assert "rate limit" in str(error).lower()
         assert error.details["limit"] == 100
         assert error.details["remaining"] == 0
 
-    def test_inheritance(self):
-        """Test rate limit error inherits from base."""
-        error = TrueNASRateLimitError("Test")
-        assert isinstance(error, TrueNASError)
-
 
 class TestValidationError:
     """Test validation error handling."""
 
     def test_validation_error_with_fields(self):
         """Test validation error with field info."""
-        error = TrueNASValidationError(
-            "Invalid input",
-            details={
-                "fields": ["username", "email"],
-                "errors": ["Username too short", "Invalid email format"]
-            }
-        )
+        error = TrueNASValidationError("Invalid input", details=_VALIDATION_DETAILS)
         assert "Invalid input" in str(error)
         assert "username" in error.details["fields"]
 
-    def test_inheritance(self):
-        """Test validation error inherits from base."""
-        error = TrueNASValidationError("Test")
-        assert isinstance(error, TrueNASError)
-
 
 class TestNotFoundError:
     """Test not found error handling."""
 
     def test_not_found_error(self):
         """Test not found error with resource info."""
-        error = TrueNASNotFoundError(
-            "Dataset not found",
-            details={"resource": "dataset", "id": "tank/nonexistent"}
-        )
+        error = TrueNASNotFoundError("Dataset not found", details=_NOT_FOUND_DETAILS)
         assert "not found" in str(error).lower()
         assert error.details["id"] == "tank/nonexistent"
 
-    def test_inheritance(self):
-        """Test not found error inherits from base."""
-        error = TrueNASNotFoundError("Test")
-        assert isinstance(error, TrueNASError)
-
 
 class TestPermissionError:
     """Test permission error handling."""
 
     def test_permission_error(self):
         """Test permission error with operation info."""
-        error = TrueNASPermissionError(
-            "Operation not permitted",
-            details={
-                "operation": "delete_user",
-                "resource": "root",
-                "reason": "Cannot delete system user"
-            }
-        )
+        error = TrueNASPermissionError("Operation not permitted", details=_PERMISSION_DETAILS)
         assert "not permitted" in str(error).lower()
         assert error.details["operation"] == "delete_user"
 
-    def test_inheritance(self):
-        """Test permission error inherits from base."""
-        error = TrueNASPermissionError("Test")
-        assert isinstance(error, TrueNASError)
-
 
 class TestConfigurationError:
     """Test configuration error handling."""
 
     def test_configuration_error(self):
         """Test configuration error with config details."""
-        error = TrueNASConfigurationError(
-            "Invalid configuration",
-            details={
-                "setting": "truenas_url",
-                "value": "invalid-url",
-                "reason": "Must be a valid URL"
-            }
-        )
+        error = TrueNASConfigurationError("Invalid configuration", details=_CONFIG_DETAILS)
         assert "configuration" in str(error).lower()
         assert error.details["setting"] == "truenas_url"
 
-    def test_inheritance(self):
-        """Test configuration error inherits from base."""
-        error = TrueNASConfigurationError("Test")
-        assert isinstance(error, TrueNASError)
+
+@pytest.mark.parametrize("cls", [
+    TrueNASConnectionError,
+    TrueNASAuthenticationError,
+    TrueNASAPIError,
+    TrueNASTimeoutError,
+    TrueNASRateLimitError,
+    TrueNASValidationError,
+    TrueNASNotFoundError,
+    TrueNASPermissionError,
+    TrueNASConfigurationError,
+])
+def test_all_inherit_from_base(cls):
+    """Test every specific error inherits from the base exception."""
+    assert issubclass(cls, TrueNASError)
+    assert isinstance(cls("Test"), Exception)
 
 
 class TestExceptionChaining:
@@ -1,19 +1,54 @@
 """Unit tests for settings configuration."""
 
+import os
+
 import pytest
-from pydantic import ValidationError, SecretStr
+from pydantic import HttpUrl, SecretStr, TypeAdapter, ValidationError
 
 from truenas_mcp_server.config.settings import Settings, Environment, LogLevel
 
+_API_KEY = SecretStr("key")
+# Validates URLs alone; the test_settings_* URL tests go through Settings itself
+_URL_ADAPTER = TypeAdapter(HttpUrl)
+
+
+def _clear_settings_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Remove every environment variable Settings would read."""
+    names = {name.upper() for name in Settings.model_fields}
+    names |= {
+        field.validation_alias.upper()
+        for field in Settings.model_fields.values()
+        if isinstance(field.validation_alias, str)
+    }
+    for var in list(os.environ):
+        if var.upper() in names or var.upper().startswith("TRUENAS_"):
+            monkeypatch.delenv(var)
+
 
 class TestSettings:
     """Test Settings configuration class."""
 
-    def test_minimal_settings(self):
+    @pytest.fixture(scope="class")
+    def base_settings(self):
+        """Settings validated once from defaults, ignoring .env and the environment.
+
+        Read-only tests assert against it or derive copies.
+        """
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            _clear_settings_env(monkeypatch)
+            return Settings(
+                truenas_url="https://truenas.local",
+                truenas_api_key=_API_KEY,
+                _env_file=None
+            )
+
+    def test_minimal_settings(self, monkeypatch):
         """Test creating settings with minimal required fields."""
+        _clear_settings_env(monkeypatch)
         settings = Settings(
             truenas_url="https://truenas.local",
-            truenas_api_key=SecretStr("test-key-12345")
+            truenas_api_key=SecretStr("test-key-12345"),
+            _env_file=None
         )
         assert str(settings.truenas_url) == "https://truenas.local/"
         assert settings.truenas_api_key.get_secret_value() == "test-key-12345"
@@ -24,21 +59,36 @@ class TestSettings:
         """Test creating settings with all fields."""
         assert str(mock_settings.truenas_url) == "https://truenas.local/"
         assert mock_settings.truenas_verify_ssl is False
-        assert mock_settings.environment == Environment.TESTING
+        assert mock_settings.environment == Environment.DEVELOPMENT
         assert mock_settings.log_level == LogLevel.DEBUG
         assert mock_settings.enable_destructive_operations is True
 
-    def test_url_validation(self):
+    @pytest.mark.parametrize("url", ["https://truenas.local", "http://192.168.1.100", "https://nas.example.com"])
+    def test_url_validation(self, url):
         """Test URL validation."""
-        # Valid URLs
-        for url in ["https://truenas.local", "http://192.168.1.100", "https://nas.example.com"]:
-            settings = Settings(truenas_url=url, truenas_api_key=SecretStr("key"))
-            assert settings.truenas_url is not None
+        assert _URL_ADAPTER.validate_python(url) is not None
 
     def test_invalid_url(self):
         """Test invalid URL raises validation error."""
         with pytest.raises(ValidationError):
-            Settings(truenas_url="not-a-url", truenas_api_key=SecretStr("key"))
+            _URL_ADAPTER.validate_python("not-a-url")
+
+    @pytest.mark.parametrize("url, api_base_url", [
+        ("https://truenas.local", "https://truenas.local/api/v2.0"),
+        ("https://truenas.local/", "https://truenas.local/api/v2.0"),
+        ("https://nas.example.com/truenas/", "https://nas.example.com/truenas/api/v2.0"),
+    ])
+    def test_settings_url_validation(self, monkeypatch, url, api_base_url):
+        """Test Settings strips the trailing slash before building the API URL."""
+        _clear_settings_env(monkeypatch)
+        settings = Settings(truenas_url=url, truenas_api_key=_API_KEY, _env_file=None)
+        assert settings.api_base_url == api_base_url
+
+    def test_settings_invalid_url(self, monkeypatch):
+        """Test Settings rejects an invalid URL."""
+        _clear_settings_env(monkeypatch)
+        with pytest.raises(ValidationError):
+            Settings(truenas_url="not-a-url", truenas_api_key=_API_KEY, _env_file=None)
 
     def test_secret_str_masking(self, mock_settings):
         """Test that API key is properly masked."""
@@ -48,31 +98,26 @@ class TestSettings:
         # But should be accessible via get_secret_value
         assert mock_settings.truenas_api_key.get_secret_value() == "test-api-key-1234567890"
 
-    def test_environment_enum(self):
+    @pytest.mark.parametrize("environment", ["development", "production"])
+    def test_environment_enum(self, environment):
         """Test environment enum values."""
+        # Built through the constructor: the string -> enum coercion is under test
         settings = Settings(
             truenas_url="https://truenas.local",
-            truenas_api_key=SecretStr("key"),
-            environment="development"
+            truenas_api_key=_API_KEY,
+            environment=environment
         )
-        assert settings.environment == Environment.DEVELOPMENT
+        assert settings.environment == Environment(environment)
 
+    @pytest.mark.parametrize("level", ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"])
+    def test_log_level_enum(self, level):
+        """Test log level enum values."""
         settings = Settings(
             truenas_url="https://truenas.local",
-            truenas_api_key=SecretStr("key"),
-            environment="production"
+            truenas_api_key=_API_KEY,
+            log_level=level
         )
-        assert settings.environment == Environment.PRODUCTION
-
-    def test_log_level_enum(self):
-        """Test log level enum values."""
-        for level in ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]:
-            settings = Settings(
-                truenas_url="https://truenas.local",
-                truenas_api_key=SecretStr("key"),
-                log_level=level
-            )
-            assert settings.log_level.value == level
+        assert settings.log_level == LogLevel(level)
 
     def test_http_settings(self, mock_settings):
         """Test HTTP client settings."""
@@ -80,19 +125,18 @@ class TestSettings:
         assert mock_settings.http_pool_connections == 10
         assert mock_settings.http_pool_maxsize == 20
         assert mock_settings.http_max_retries == 3
-        assert mock_settings.http_retry_backoff_factor == 2.0
 
     def test_feature_flags(self, mock_settings):
         """Test feature flag settings."""
         assert mock_settings.enable_destructive_operations is True
-        assert mock_settings.enable_cache is True
-        assert mock_settings.enable_metrics is False
+        assert mock_settings.enable_cache is False
+        assert mock_settings.enable_debug_tools is False
 
     def test_cache_settings(self):
         """Test cache configuration settings."""
         settings = Settings(
             truenas_url="https://truenas.local",
-            truenas_api_key=SecretStr("key"),
+            truenas_api_key=_API_KEY,
             cache_ttl=300,
             cache_max_size=500
         )
@@ -103,19 +147,16 @@ class TestSettings:
         """Test rate limiting settings."""
         settings = Settings(
             truenas_url="https://truenas.local",
-            truenas_api_key=SecretStr("key"),
+            truenas_api_key=_API_KEY,
             rate_limit_per_minute=100,
             rate_limit_burst=10
         )
         assert settings.rate_limit_per_minute == 100
         assert settings.rate_limit_burst == 10
 
-    def test_default_values(self):
+    def test_default_values(self, base_settings):
         """Test default values are properly set."""
-        settings = Settings(
-            truenas_url="https://truenas.local",
-            truenas_api_key=SecretStr("key")
-        )
+        settings = base_settings
         assert settings.truenas_verify_ssl is True
         assert settings.environment == Environment.PRODUCTION
         assert settings.log_level == LogLevel.INFO
@@ -123,21 +164,20 @@ class TestSettings:
         assert settings.http_timeout == 60.0
         assert settings.http_max_retries == 3
 
-    def test_settings_immutability(self, mock_settings):
-        """Test that settings are properly configured (Pydantic v2 is mutable by default)."""
-        # In Pydantic v2, models are mutable unless frozen=True
-        # This test verifies we can update if needed
-        original_timeout = mock_settings.http_timeout
-        mock_settings.http_timeout = 120.0
-        assert mock_settings.http_timeout == 120.0
-        # Reset for other tests
-        mock_settings.http_timeout = original_timeout
+    def test_settings_immutability(self, base_settings):
+        """Test that settings are frozen and variants are derived by copying."""
+        with pytest.raises(ValidationError):
+            base_settings.http_timeout = 120.0
+
+        updated = base_settings.model_copy(update={"http_timeout": 120.0})
+        assert updated.http_timeout == 120.0
+        assert base_settings.http_timeout != 120.0
 
     def test_boolean_parsing(self):
         """Test boolean value parsing from strings."""
         settings = Settings(
             truenas_url="https://truenas.local",
-            truenas_api_key=SecretStr("key"),
+            truenas_api_key=_API_KEY,
             truenas_verify_ssl="false",  # String that should parse to bool
             enable_destructive_operations="true"
         )
@@ -148,12 +188,10 @@ class TestSettings:
 class TestEnvironment:
     """Test Environment enum."""
 
-    def test_environment_values(self):
+    @pytest.mark.parametrize("value", ["development", "testing", "staging", "production"])
+    def test_environment_values(self, value):
         """Test all environment enum values."""
-        assert Environment.DEVELOPMENT.value == "development"
-        assert Environment.TESTING.value == "testing"
-        assert Environment.STAGING.value == "staging"
-        assert Environment.PRODUCTION.value == "production"
+        assert Environment[value.upper()].value == value
 
     def test_environment_comparison(self):
         """Test environment comparison."""
@@ -164,13 +202,10 @@ class TestEnvironment:
 class TestLogLevel:
     """Test LogLevel enum."""
 
-    def test_log_level_values(self):
+    @pytest.mark.parametrize("level", ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"])
+    def test_log_level_values(self, level):
         """Test all log level enum values."""
-        assert LogLevel.DEBUG.value == "DEBUG"
-        assert LogLevel.INFO.value == "INFO"
-        assert LogLevel.WARNING.value == "WARNING"
-        assert LogLevel.ERROR.value == "ERROR"
-        assert LogLevel.CRITICAL.value == "CRITICAL"
+        assert LogLevel[level].value == level
 
     def test_log_level_comparison(self):
         """Test log level comparison."""
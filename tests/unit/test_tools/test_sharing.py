@@ -0,0 +1,32 @@
+"""Unit tests for sharing tools."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+from pydantic import HttpUrl
+
+from truenas_mcp_server.tools.sharing import SharingTools
+
+
+@pytest.fixture
+def sharing_tools(make_tools):
+    """Create sharing tools instance with a mocked client."""
+    return make_tools(SharingTools)
+
+
+class TestCreateNFSExport:
+    """Test NFS export creation."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("url", [
+        "https://nas.local",
+        "https://nas.local:8443/",
+    ])
+    async def test_mount_example_uses_host(self, make_tools, url):
+        """Test the mount example names only the TrueNAS host."""
+        sharing_tools = make_tools(SharingTools, truenas_url=HttpUrl(url))
+        sharing_tools.client.post = AsyncMock(return_value={"id": 1, "path": "/mnt/tank/share"})
+
+        result = await sharing_tools.create_nfs_export("tank/share")
+
+        assert result["mount_example"] == "mount -t nfs nas.local:/mnt/tank/share /local/mount/point"
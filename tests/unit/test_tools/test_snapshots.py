@@ -0,0 +1,75 @@
+"""Unit tests for snapshot tools."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from truenas_mcp_server.tools.snapshots import SnapshotTools
+
+
+@pytest.fixture
+def snapshot_tools(make_tools):
+    """Create snapshot tools instance with a mocked client."""
+    return make_tools(SnapshotTools)
+
+
+class TestCreateSnapshotTasks:
+    """Test bulk snapshot task creation."""
+
+    @pytest.mark.asyncio
+    async def test_multiple_tasks_use_one_bulk_call(self, snapshot_tools):
+        """Test that several tasks are submitted as a single core.bulk job."""
+        snapshot_tools.client.post = AsyncMock(return_value=42)
+        schedule = {"minute": "0", "hour": "*/4"}
+
+        result = await snapshot_tools.create_snapshot_tasks([
+            {"dataset": "tank/a", "schedule": dict(schedule), "retention": 7},
+            {"dataset": "tank/b", "schedule": dict(schedule), "retention": 2,
+             "retention_unit": "WEEK"},
+        ])
+
+        assert result["success"] is True
+        assert result["job_id"] == 42
+        snapshot_tools.client.post.assert_awaited_once()
+        endpoint, body = snapshot_tools.client.post.call_args.args
+        assert endpoint == "/core/bulk"
+        assert body["method"] == "pool.snapshottask.create"
+        assert [p[0]["dataset"] for p in body["params"]] == ["tank/a", "tank/b"]
+        assert body["params"][1][0]["lifetime_unit"] == "WEEK"
+        assert body["params"][0][0]["schedule"]["dom"] == "*"
+
+    @pytest.mark.asyncio
+    async def test_single_task_uses_same_shape(self, snapshot_tools):
+        """Test that one task is submitted and reported like several."""
+        snapshot_tools.client.post = AsyncMock(return_value=7)
+
+        result = await snapshot_tools.create_snapshot_tasks([
+            {"dataset": "tank/a", "schedule": {"minute": "0"}, "retention": 7},
+        ])
+
+        assert result["success"] is True
+        assert result["status"] == "submitted"
+        assert result["job_id"] == 7
+        assert result["datasets"] == ["tank/a"]
+        assert snapshot_tools.client.post.call_args.args[0] == "/core/bulk"
+
+    @pytest.mark.asyncio
+    async def test_invalid_spec_rejects_whole_batch(self, snapshot_tools):
+        """Test that a spec missing required fields fails before any request."""
+        snapshot_tools.client.post = AsyncMock()
+
+        result = await snapshot_tools.create_snapshot_tasks([
+            {"dataset": "tank/a", "schedule": {"minute": "0"}, "retention": 7},
+            {"schedule": {"minute": "0"}},
+        ])
+
+        assert result["success"] is False
+        assert result["error"] == "Snapshot task 2 is missing required fields: dataset, retention"
+        snapshot_tools.client.post.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_empty_task_list_is_rejected(self, snapshot_tools):
+        """Test that an empty task list returns an error response."""
+        result = await snapshot_tools.create_snapshot_tasks([])
+
+        assert result["success"] is False
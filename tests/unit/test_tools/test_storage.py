@@ -1,17 +1,18 @@
 """Unit tests for storage tools."""
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock
 
+from truenas_mcp_server.tools.base import _format_size, _parse_size
 from truenas_mcp_server.tools.storage import StorageTools
-from truenas_mcp_server.exceptions import TrueNASValidationError, TrueNASNotFoundError
+from truenas_mcp_server.exceptions import TrueNASAPIError
 
 
 class TestStorageTools:
     """Test storage management tools."""
 
     @pytest.fixture
-    async def storage_tools(self, mock_truenas_client, mock_settings):
+    def storage_tools(self, mock_truenas_client, mock_settings):
         """Create storage tools instance for testing."""
         tools = StorageTools(client=mock_truenas_client, settings=mock_settings)
         return tools
@@ -19,9 +20,9 @@ class TestStorageTools:
     @pytest.mark.asyncio
     async def test_list_pools(self, storage_tools, mock_pool_response):
         """Test listing storage pools."""
-        storage_tools.client.request = AsyncMock(return_value=mock_pool_response)
+        storage_tools.client.get = AsyncMock(return_value=mock_pool_response)
 
-        result = await storage_tools.list_pools({})
+        result = await storage_tools.list_pools()
 
         assert "pools" in result
         assert len(result["pools"]) == 1
@@ -31,20 +32,24 @@ class TestStorageTools:
     @pytest.mark.asyncio
     async def test_get_pool_details(self, storage_tools, mock_pool_response):
         """Test getting pool details."""
-        storage_tools.client.request = AsyncMock(return_value=mock_pool_response[0])
+        storage_tools.client.get = AsyncMock(return_value=mock_pool_response)
 
-        result = await storage_tools.get_pool({"pool_name": "tank"})
+        result = await storage_tools.get_pool_status("tank")
 
-        assert result["name"] == "tank"
-        assert result["status"] == "ONLINE"
-        assert "size" in result
+        assert result["pool"]["name"] == "tank"
+        assert result["pool"]["status"] == "ONLINE"
+        assert "size" in result["pool"]["capacity"]
 
     @pytest.mark.asyncio
     async def test_list_datasets(self, storage_tools, mock_dataset_response):
         """Test listing datasets."""
-        storage_tools.client.request = AsyncMock(return_value=mock_dataset_response)
+        async def iter_items(endpoint, params=None):
+            for ds in mock_dataset_response:
+                yield ds
 
-        result = await storage_tools.list_datasets({"pool_name": "tank"})
+        storage_tools.client.iter_items = iter_items
+
+        result = await storage_tools.list_datasets()
 
         assert "datasets" in result
         assert len(result["datasets"]) >= 1
@@ -53,63 +58,89 @@ class TestStorageTools:
     @pytest.mark.asyncio
     async def test_create_dataset_validation(self, storage_tools):
         """Test dataset creation with missing required fields."""
-        with pytest.raises(TrueNASValidationError):
-            await storage_tools.create_dataset({})
+        result = await storage_tools.create_dataset()
+        assert result["success"] is False
 
-        with pytest.raises(TrueNASValidationError):
-            await storage_tools.create_dataset({"pool_name": "tank"})
+        result = await storage_tools.create_dataset(pool="tank")
+        assert result["success"] is False
 
     @pytest.mark.asyncio
     async def test_create_dataset_success(self, storage_tools, mock_dataset_response):
         """Test successful dataset creation."""
-        storage_tools.client.request = AsyncMock(return_value=mock_dataset_response[0])
-
-        result = await storage_tools.create_dataset({
-            "pool_name": "tank",
-            "dataset_name": "newdata"
-        })
-
-        assert result["name"] == "data"
-        storage_tools.client.request.assert_called_once()
+        storage_tools.client.post = AsyncMock(return_value=mock_dataset_response[0])
 
-    @pytest.mark.asyncio
-    async def test_delete_dataset_validation(self, storage_tools):
-        """Test dataset deletion validation."""
-        with pytest.raises(TrueNASValidationError):
-            await storage_tools.delete_dataset({})
+        result = await storage_tools.create_dataset(pool="tank", name="newdata")
 
-    @pytest.mark.asyncio
-    async def test_format_size_bytes(self, storage_tools):
-        """Test size formatting for bytes."""
-        assert storage_tools._format_size(1024) == "1.0 KB"
-        assert storage_tools._format_size(1024 * 1024) == "1.0 MB"
-        assert storage_tools._format_size(1024 * 1024 * 1024) == "1.0 GB"
-        assert storage_tools._format_size(1024 * 1024 * 1024 * 1024) == "1.0 TB"
+        assert result["dataset"]["name"] == "data"
+        storage_tools.client.post.assert_called_once()
+        assert storage_tools.client.post.call_args.args[1]["name"] == "tank/newdata"
 
     @pytest.mark.asyncio
-    async def test_parse_size_string(self, storage_tools):
-        """Test parsing size strings."""
-        assert storage_tools._parse_size("1GB") == 1024 * 1024 * 1024
-        assert storage_tools._parse_size("500MB") == 500 * 1024 * 1024
-        assert storage_tools._parse_size("1TB") == 1024 * 1024 * 1024 * 1024
-        assert storage_tools._parse_size("100") == 100  # Plain number
-
-    @pytest.mark.asyncio
-    async def test_get_tool_definitions(self, storage_tools):
-        """Test tool definitions are properly defined."""
-        definitions = storage_tools.get_tool_definitions()
-
-        assert len(definitions) > 0
-        assert any(tool["name"] == "list_pools" for tool in definitions)
-        assert any(tool["name"] == "list_datasets" for tool in definitions)
-        assert any(tool["name"] == "create_dataset" for tool in definitions)
+    async def test_delete_dataset_validation(self, storage_tools, mock_settings):
+        """Test dataset deletion is refused when destructive operations are off."""
+        storage_tools.settings = mock_settings.model_copy(
+            update={"enable_destructive_operations": False}
+        )
+        storage_tools.client.delete = AsyncMock()
+
+        result = await storage_tools.delete_dataset("tank/data")
+
+        assert result["success"] is False
+        storage_tools.client.delete.assert_not_called()
+
+
+class TestSizeHelpers:
+    """Test the module-level size formatting and parsing helpers."""
+
+    @pytest.mark.parametrize("size, expected", [
+        (0, "0.00 B"),
+        (512, "512.00 B"),
+        (1024, "1.00 KB"),
+        (1024 ** 2, "1.00 MB"),
+        (1024 ** 3, "1.00 GB"),
+        (1024 ** 4, "1.00 TB"),
+        (1536 * 1024 ** 4, "1.50 PB"),
+        (1024 ** 6, "1.00 EB"),
+    ])
+    def test_format_size(self, size, expected):
+        """Test size formatting picks the largest whole unit."""
+        assert _format_size(size) == expected
+
+    @pytest.mark.parametrize("size_str, expected", [
+        ("100", 100),
+        ("100B", 100),
+        ("1K", 1024),
+        ("1KB", 1024),
+        ("500M", 500 * 1024 ** 2),
+        ("500MB", 500 * 1024 ** 2),
+        ("1G", 1024 ** 3),
+        ("1.5G", int(1.5 * 1024 ** 3)),
+        ("1TB", 1024 ** 4),
+        ("2P", 2 * 1024 ** 5),
+        (" 10 gb ", 10 * 1024 ** 3),
+    ])
+    def test_parse_size(self, size_str, expected):
+        """Test size parsing accepts each unit with or without a trailing B."""
+        assert _parse_size(size_str) == expected
+
+    @pytest.mark.parametrize("size_str", ["", "G", "abc", "10X", "1.2.3G"])
+    def test_parse_size_invalid(self, size_str):
+        """Test malformed size strings are rejected."""
+        with pytest.raises(ValueError, match="Invalid size format"):
+            _parse_size(size_str)
+
+    def test_tool_methods_delegate(self, make_tools):
+        """Test BaseTool.format_size/parse_size use the shared helpers."""
+        tools = make_tools(StorageTools)
+        assert tools.format_size(1024) == _format_size(1024)
+        assert tools.parse_size("1G") == _parse_size("1G")
 
 
 class TestDatasetOperations:
     """Test dataset-specific operations."""
 
     @pytest.fixture
-    async def storage_tools(self, mock_truenas_client, mock_settings):
+    def storage_tools(self, mock_truenas_client, mock_settings):
         """Create storage tools instance."""
         tools = StorageTools(client=mock_truenas_client, settings=mock_settings)
         return tools
@@ -117,46 +148,273 @@ class TestDatasetOperations:
     @pytest.mark.asyncio
     async def test_set_dataset_quota(self, storage_tools):
         """Test setting dataset quota."""
-        storage_tools.client.request = AsyncMock(return_value={"status": "success"})
+        storage_tools.client.put = AsyncMock(return_value={"id": "tank/data", "name": "tank/data"})
 
-        result = await storage_tools.set_quota({
-            "dataset_id": "tank/data",
-            "quota": "100GB"
-        })
+        result = await storage_tools.update_dataset("tank/data", {"quota": "100GB"})
 
-        assert "success" in result or result.get("status") == "success"
+        assert result["success"] is True
+        storage_tools.client.put.assert_awaited_once_with(
+            "/pool/dataset/id/tank%2Fdata", {"quota": 100 * 1024 ** 3}
+        )
 
-    @pytest.mark.asyncio
-    async def test_dataset_compression_settings(self, storage_tools, mock_dataset_response):
+    def test_dataset_compression_settings(self, mock_dataset_response):
         """Test dataset compression configuration."""
         dataset = mock_dataset_response[0]
         assert dataset["compression"] == "lz4"
 
-    @pytest.mark.asyncio
-    async def test_dataset_deduplication_settings(self, storage_tools, mock_dataset_response):
+    def test_dataset_deduplication_settings(self, mock_dataset_response):
         """Test dataset deduplication configuration."""
         dataset = mock_dataset_response[0]
         assert dataset["deduplication"]["value"] == "off"
 
 
-class TestPoolOperations:
-    """Test pool-specific operations."""
+def _stream(records):
+    """Build a fake TrueNASClient.iter_items yielding ``records``."""
+    async def iter_items(endpoint, params=None):
+        for record in records:
+            yield record
+
+    return iter_items
+
+
+class TestListDatasetsPagination:
+    """Test paging and summaries of the streamed dataset listing."""
+
+    DATASETS = [
+        {"name": "tank", "pool": "tank", "encrypted": False, "compression": {"value": "lz4"}},
+        {"name": "tank/a", "pool": "tank", "encrypted": True, "compression": {"value": "off"}},
+        {"name": "tank/b", "pool": "tank", "encrypted": False, "compression": "zstd"},
+        {"name": "backup", "pool": "backup", "encrypted": True, "compression": "off"},
+        {"name": "backup/c", "pool": "backup", "encrypted": False},
+    ]
 
     @pytest.fixture
-    async def storage_tools(self, mock_truenas_client, mock_settings):
-        """Create storage tools instance."""
-        tools = StorageTools(client=mock_truenas_client, settings=mock_settings)
+    def storage_tools(self, make_tools):
+        """Create storage tools whose client streams DATASETS."""
+        tools = make_tools(StorageTools)
+        tools.client.iter_items = _stream(self.DATASETS)
+        return tools
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("limit, offset, names, has_more", [
+        (2, 0, ["tank", "tank/a"], True),
+        (2, 2, ["tank/b", "backup"], True),
+        (2, 4, ["backup/c"], False),
+        (5, 0, ["tank", "tank/a", "tank/b", "backup", "backup/c"], False),
+        (2, 5, [], False),
+        (2, 9, [], False),
+    ])
+    async def test_page_bounds(self, storage_tools, limit, offset, names, has_more):
+        """Test each page holds exactly the requested slice."""
+        result = await storage_tools.list_datasets(limit=limit, offset=offset)
+
+        assert [d["name"] for d in result["datasets"]] == names
+        assert result["pagination"] == {
+            "total": 5,
+            "limit": limit,
+            "offset": offset,
+            "returned": len(names),
+            "has_more": has_more,
+        }
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("offset", [0, 3])
+    async def test_summary_counts_every_dataset(self, storage_tools, offset):
+        """Test the metadata tallies the whole listing, not just the page."""
+        result = await storage_tools.list_datasets(limit=1, offset=offset)
+
+        assert result["metadata"] == {
+            "by_pool": {"tank": 3, "backup": 2},
+            "encrypted_datasets": 2,
+            "compressed_datasets": 2,
+        }
+
+    @pytest.mark.asyncio
+    async def test_limit_is_capped(self, storage_tools):
+        """Test limits above MAX_LIMIT are clamped."""
+        result = await storage_tools.list_datasets(limit=10_000)
+
+        assert result["pagination"]["limit"] == StorageTools.MAX_LIMIT
+        assert result["pagination"]["returned"] == 5
+
+
+class TestFindDataset:
+    """Test dataset lookup by name."""
+
+    @pytest.fixture
+    def storage_tools(self, make_tools):
+        """Create storage tools whose client streams three datasets."""
+        tools = make_tools(StorageTools)
+        tools.streamed = []
+        tools.client.get = AsyncMock(
+            side_effect=TrueNASAPIError("Client error (400)", {"status_code": 400})
+        )
+
+        async def iter_items(endpoint, params=None):
+            for name in ("tank", "tank/data", "tank/other"):
+                tools.streamed.append(name)
+                yield {"id": name, "name": name}
+
+        tools.client.iter_items = iter_items
         return tools
 
     @pytest.mark.asyncio
-    async def test_pool_health_check(self, storage_tools, mock_pool_response):
+    async def test_name_filter_is_sent_to_server(self, storage_tools):
+        """Test the lookup asks TrueNAS for the one dataset only."""
+        storage_tools.client.get = AsyncMock(return_value=[{"id": "tank/data", "name": "tank/data"}])
+
+        dataset = await storage_tools._find_dataset("tank/data")
+
+        storage_tools.client.get.assert_awaited_once_with("/pool/dataset", params={"name": "tank/data"})
+        assert dataset["name"] == "tank/data"
+        assert storage_tools.streamed == []
+
+    @pytest.mark.asyncio
+    async def test_ignored_filter_still_matches_name(self, storage_tools):
+        """Test an unfiltered response never resolves to another dataset."""
+        storage_tools.client.get = AsyncMock(return_value=[
+            {"id": "tank", "name": "tank"}, {"id": "tank/data", "name": "tank/data"},
+        ])
+
+        assert (await storage_tools._find_dataset("tank/data"))["id"] == "tank/data"
+        assert await storage_tools._find_dataset("tank/missing") is None
+
+    @pytest.mark.asyncio
+    async def test_stops_at_first_match(self, storage_tools):
+        """Test the fallback scan stops reading once the dataset is found."""
+        dataset = await storage_tools._find_dataset("tank/data")
+
+        assert dataset == {"id": "tank/data", "name": "tank/data"}
+        assert storage_tools.streamed == ["tank", "tank/data"]
+
+    @pytest.mark.asyncio
+    async def test_missing_dataset(self, storage_tools):
+        """Test an unknown name scans everything and returns None."""
+        assert await storage_tools._find_dataset("tank/missing") is None
+        assert storage_tools.streamed == ["tank", "tank/data", "tank/other"]
+
+
+class TestFindPool:
+    """Test pool lookup by name or ID."""
+
+    @pytest.fixture
+    def storage_tools(self, make_tools):
+        """Create storage tools instance with a mocked client."""
+        return make_tools(StorageTools)
+
+    @pytest.mark.asyncio
+    async def test_name_filter_is_sent_to_server(self, storage_tools):
+        """Test a pool name is looked up with one filtered request."""
+        storage_tools.client.get = AsyncMock(return_value=[{"id": 1, "name": "tank"}])
+
+        result = await storage_tools.get_pool_status("tank")
+
+        storage_tools.client.get.assert_awaited_once_with("/pool", params={"name": "tank"})
+        assert result["pool"]["id"] == 1
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_scan_when_filter_rejected(self, storage_tools):
+        """Test a 400 for the filter falls back to scanning the listing."""
+        storage_tools.client.get = AsyncMock(side_effect=[
+            TrueNASAPIError("Client error (400)", {"status_code": 400}),
+            [{"id": 1, "name": "backup"}, {"id": 2, "name": "tank"}],
+        ])
+
+        result = await storage_tools.get_pool_status("tank")
+
+        assert storage_tools.client.get.await_args_list[1].args == ("/pool",)
+        assert result["pool"]["id"] == 2
+
+    @pytest.mark.asyncio
+    async def test_ignored_filter_still_matches_name(self, storage_tools):
+        """Test an unfiltered response never resolves to another pool."""
+        storage_tools.client.get = AsyncMock(return_value=[
+            {"id": 1, "name": "backup"}, {"id": 2, "name": "tank"},
+        ])
+
+        assert (await storage_tools.get_pool_status("tank"))["pool"]["id"] == 2
+        assert (await storage_tools.get_pool_status("scratch"))["success"] is False
+
+    @pytest.mark.asyncio
+    async def test_other_errors_are_not_swallowed(self, storage_tools):
+        """Test errors other than a rejected filter fail the call."""
+        storage_tools.client.get = AsyncMock(
+            side_effect=TrueNASAPIError("Server error (500)", {"status_code": 500})
+        )
+
+        result = await storage_tools.get_pool_status("tank")
+
+        assert result["success"] is False
+        storage_tools.client.get.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_numeric_id(self, storage_tools):
+        """Test a numeric argument is looked up as a pool ID."""
+        storage_tools.client.get = AsyncMock(return_value={"id": 2, "name": "tank"})
+
+        result = await storage_tools.get_pool_status("2")
+
+        storage_tools.client.get.assert_awaited_once_with("/pool/id/2")
+        assert result["pool"]["name"] == "tank"
+
+    @pytest.mark.asyncio
+    async def test_unknown_id(self, storage_tools):
+        """Test a 404 for a pool ID is reported as not found."""
+        storage_tools.client.get = AsyncMock(
+            side_effect=TrueNASAPIError("Client error (404)", {"status_code": 404})
+        )
+
+        result = await storage_tools.get_pool_status("9")
+
+        assert result == {"success": False, "error": "Pool '9' not found"}
+
+
+class TestUpdateDataset:
+    """Test dataset property updates."""
+
+    @pytest.fixture
+    def storage_tools(self, make_tools):
+        """Create storage tools instance with a mocked client."""
+        return make_tools(StorageTools)
+
+    @pytest.mark.asyncio
+    async def test_updates_by_name_without_lookup(self, storage_tools):
+        """Test the dataset name is used as its ID directly."""
+        storage_tools.client.get = AsyncMock()
+        storage_tools.client.put = AsyncMock(return_value={"id": "tank/data", "name": "tank/data"})
+
+        result = await storage_tools.update_dataset("tank/data", {"quota": "1G"})
+
+        storage_tools.client.put.assert_awaited_once_with(
+            "/pool/dataset/id/tank%2Fdata", {"quota": 1024 ** 3}
+        )
+        storage_tools.client.get.assert_not_awaited()
+        assert result["success"] is True
+
+    @pytest.mark.asyncio
+    async def test_missing_dataset(self, storage_tools):
+        """Test a 404 for the name is reported as not found."""
+        storage_tools.client.put = AsyncMock(
+            side_effect=TrueNASAPIError("Client error (404)", {"status_code": 404})
+        )
+        storage_tools.client.get = AsyncMock(return_value=[])
+
+        result = await storage_tools.update_dataset("tank/missing", {"atime": "off"})
+
+        assert result["success"] is False
+        assert "not found" in result["error"]
+
+
+class TestPoolOperations:
+    """Test pool-specific operations."""
+
+    def test_pool_health_check(self, mock_pool_response):
         """Test pool health checking."""
         pool = mock_pool_response[0]
         assert pool["healthy"] is True
         assert pool["status"] == "ONLINE"
 
-    @pytest.mark.asyncio
-    async def test_pool_capacity_calculation(self, storage_tools, mock_pool_response):
+    def test_pool_capacity_calculation(self, mock_pool_response):
         """Test pool capacity calculations."""
         pool = mock_pool_response[0]
         total = pool["size"]
@@ -166,8 +424,7 @@ class TestPoolOperations:
         assert total == allocated + free
         assert total == 4000000000000  # 4TB
 
-    @pytest.mark.asyncio
-    async def test_pool_topology(self, storage_tools, mock_pool_response):
+    def test_pool_topology(self, mock_pool_response):
         """Test pool topology information."""
         pool = mock_pool_response[0]
         assert "topology" in pool
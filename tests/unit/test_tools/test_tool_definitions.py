@@ -0,0 +1,40 @@
+"""Unit tests for tool definitions across all tool classes."""
+
+import pytest
+
+from truenas_mcp_server.tools import (
+    AppTools,
+    DebugTools,
+    InstanceTools,
+    LegacyVMTools,
+    SharingTools,
+    SnapshotTools,
+    StorageTools,
+    UserTools,
+)
+
+TOOL_DEFINITION_CASES = [
+    (DebugTools, {"debug_connection", "test_connection", "get_server_stats"}),
+    (UserTools, {"list_users", "list_custom_users", "get_user", "create_user"}),
+    (StorageTools, {"list_pools", "list_datasets", "create_dataset"}),
+    (SharingTools, {"list_smb_shares", "list_nfs_exports", "create_nfs_export"}),
+    (SnapshotTools, {"list_snapshots", "create_snapshot_task", "create_snapshot_tasks"}),
+    (AppTools, {"list_apps", "get_app", "get_app_config"}),
+    (InstanceTools, {"list_instances", "get_instance", "list_instance_devices"}),
+    (LegacyVMTools, {"list_legacy_vms", "get_legacy_vm", "get_legacy_vm_status"}),
+]
+
+
+@pytest.mark.parametrize(
+    "tool_cls, expected",
+    TOOL_DEFINITION_CASES,
+    ids=[cls.__name__ for cls, _ in TOOL_DEFINITION_CASES],
+)
+def test_tool_definitions(make_tools, tool_cls, expected):
+    """Test each tool class registers its expected tools."""
+    tool = make_tools(tool_cls)
+    definitions = tool.get_tool_definitions()
+
+    names = {definition[0] for definition in definitions}
+    assert expected <= names
+    assert all(callable(definition[1]) for definition in definitions)
@@ -0,0 +1,312 @@
+"""Unit tests for user tools."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from truenas_mcp_server.cache import decorators
+from truenas_mcp_server.exceptions import TrueNASAPIError
+from truenas_mcp_server.tools.users import UserTools, _format_user
+
+
+@pytest.fixture
+def user_tools(make_tools):
+    """Create user tools instance with a mocked client."""
+    return make_tools(UserTools)
+
+
+class TestFormatUser:
+    """Test projection of raw user records."""
+
+    def test_missing_groups_are_not_shared(self):
+        """Test each user without groups gets its own empty list."""
+        first = _format_user({"username": "alice"})
+        second = _format_user({"username": "bob"})
+
+        first["groups"].append(1000)
+
+        assert second["groups"] == []
+        assert _format_user({"username": "carol"})["groups"] == []
+
+    def test_groups_are_copied(self):
+        """Test the formatted groups list is not the raw record's list."""
+        raw = {"username": "alice", "groups": [1000]}
+
+        _format_user(raw)["groups"].append(1001)
+
+        assert raw["groups"] == [1000]
+
+
+class TestListUsersPagination:
+    """Test paging and summaries of the streamed user listing."""
+
+    USERS = [
+        {"id": 1, "username": "root", "builtin": True, "locked": False},
+        {"id": 2, "username": "daemon", "builtin": True, "locked": True},
+        {"id": 3, "username": "alice", "builtin": False, "locked": False},
+        {"id": 4, "username": "bob", "builtin": False, "locked": True},
+        {"id": 5, "username": "carol", "builtin": False},
+    ]
+
+    @pytest.fixture
+    def streaming_user_tools(self, user_tools):
+        """User tools whose client streams USERS."""
+        async def iter_items(endpoint, params=None):
+            for user in self.USERS:
+                yield user
+
+        user_tools.client.iter_items = iter_items
+        return user_tools
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("limit, offset, names, has_more", [
+        (2, 0, ["root", "daemon"], True),
+        (2, 3, ["bob", "carol"], False),
+        (10, 0, ["root", "daemon", "alice", "bob", "carol"], False),
+        (2, 5, [], False),
+    ])
+    async def test_page_bounds(self, streaming_user_tools, limit, offset, names, has_more):
+        """Test each page holds exactly the requested slice."""
+        result = await streaming_user_tools.list_users(limit=limit, offset=offset)
+
+        assert [u["username"] for u in result["users"]] == names
+        assert result["pagination"] == {
+            "total": 5,
+            "limit": limit,
+            "offset": offset,
+            "returned": len(names),
+            "has_more": has_more,
+        }
+
+    @pytest.mark.asyncio
+    async def test_summary_counts_every_user(self, streaming_user_tools):
+        """Test the metadata tallies the whole listing, not just the page."""
+        result = await streaming_user_tools.list_users(limit=1, offset=4)
+
+        assert result["metadata"] == {
+            "total_count": 5,
+            "system_users": 2,
+            "regular_users": 3,
+            "locked_users": 2,
+        }
+
+
+class TestListCustomUsers:
+    """Test listing non-builtin users."""
+
+    @pytest.mark.asyncio
+    async def test_builtin_filter_is_sent_to_server(self, user_tools):
+        """Test that the builtin filter is pushed into the query string."""
+        user_tools.client.get = AsyncMock(return_value=[
+            {"id": 1, "username": "alice", "builtin": False},
+            {"id": 2, "username": "bob", "builtin": False},
+        ])
+
+        result = await user_tools.list_custom_users(limit=1)
+
+        user_tools.client.get.assert_awaited_once_with("/user", params={"builtin": False})
+        assert result["success"] is True
+        assert [u["username"] for u in result["users"]] == ["alice"]
+        assert result["pagination"]["total"] == 2
+        assert result["pagination"]["has_more"] is True
+
+    @pytest.mark.asyncio
+    async def test_ignored_filter_still_excludes_builtin(self, user_tools):
+        """Test that builtin users are dropped even if the server ignores the filter."""
+        user_tools.client.get = AsyncMock(return_value=[
+            {"id": 0, "username": "root", "builtin": True},
+            {"id": 1, "username": "alice", "builtin": False},
+        ])
+
+        result = await user_tools.list_custom_users()
+
+        assert [u["username"] for u in result["users"]] == ["alice"]
+        assert result["pagination"]["total"] == 1
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_local_filter_when_rejected(self, user_tools):
+        """Test that a 400 for the filter falls back to filtering the full list."""
+        user_tools.client.get = AsyncMock(side_effect=[
+            TrueNASAPIError("Client error (400)", {"status_code": 400}),
+            [
+                {"id": 0, "username": "root", "builtin": True},
+                {"id": 1, "username": "alice", "builtin": False},
+            ],
+        ])
+
+        result = await user_tools.list_custom_users()
+
+        assert user_tools.client.get.await_args_list[1].args == ("/user",)
+        assert [u["username"] for u in result["users"]] == ["alice"]
+        assert result["pagination"]["total"] == 1
+
+    @pytest.mark.asyncio
+    async def test_other_errors_are_not_swallowed(self, user_tools):
+        """Test that errors other than a rejected filter still fail the call."""
+        user_tools.client.get = AsyncMock(
+            side_effect=TrueNASAPIError("Server error (500)", {"status_code": 500})
+        )
+
+        result = await user_tools.list_custom_users()
+
+        assert result["success"] is False
+        user_tools.client.get.assert_awaited_once()
+
+
+class TestGetUser:
+    """Test single-user lookup."""
+
+    @pytest.mark.asyncio
+    async def test_username_filter_is_sent_to_server(self, user_tools):
+        """Test that the lookup asks TrueNAS for the one user only."""
+        user_tools.client.get = AsyncMock(return_value=[{"id": 1, "username": "alice"}])
+
+        result = await user_tools.get_user("alice")
+
+        user_tools.client.get.assert_awaited_once_with("/user", params={"username": "alice"})
+        assert result["success"] is True
+        assert result["user"]["username"] == "alice"
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_scan_when_filter_rejected(self, user_tools):
+        """Test that a 400 for the filter falls back to scanning the list."""
+        user_tools.client.get = AsyncMock(side_effect=[
+            TrueNASAPIError("Client error (400)", {"status_code": 400}),
+            [{"id": 1, "username": "bob"}, {"id": 2, "username": "alice"}],
+        ])
+
+        result = await user_tools.get_user("alice")
+
+        assert result["user"]["id"] == 2
+
+    @pytest.mark.asyncio
+    async def test_ignored_filter_still_matches_username(self, user_tools):
+        """Test that an unfiltered response never resolves to another user."""
+        user_tools.client.get = AsyncMock(return_value=[
+            {"id": 1, "username": "bob"}, {"id": 2, "username": "alice"},
+        ])
+
+        assert (await user_tools.get_user("alice"))["user"]["id"] == 2
+        assert (await user_tools.get_user("carol"))["success"] is False
+
+    @pytest.mark.asyncio
+    async def test_unknown_user(self, user_tools):
+        """Test that an empty filtered result reports not found."""
+        user_tools.client.get = AsyncMock(return_value=[])
+
+        result = await user_tools.get_user("nobody")
+
+        assert result["success"] is False
+        assert "not found" in result["error"]
+
+
+class TestUserCache:
+    """Test caching of user listings."""
+
+    @pytest.fixture
+    def cached_user_tools(self, make_tools, cache_manager):
+        """User tools with result caching enabled."""
+        user_tools = make_tools(UserTools, enable_cache=True)
+        user_tools.client.get = AsyncMock(return_value=[{"id": 1, "username": "alice"}])
+        return user_tools
+
+    @pytest.mark.asyncio
+    async def test_repeat_listing_is_served_from_cache(self, cached_user_tools):
+        """Test that an identical listing does not hit TrueNAS again."""
+        first = await cached_user_tools.list_custom_users()
+        second = await cached_user_tools.list_custom_users()
+
+        assert first == second
+        cached_user_tools.client.get.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_cached_results_are_copies(self, cached_user_tools):
+        """Test that mutating a returned result does not alter later hits."""
+        first = await cached_user_tools.list_custom_users()
+        first["users"][0]["username"] = "mallory"
+        first["users"].clear()
+
+        second = await cached_user_tools.list_custom_users()
+
+        assert [u["username"] for u in second["users"]] == ["alice"]
+
+    @pytest.mark.asyncio
+    async def test_write_invalidates_cache(self, cached_user_tools):
+        """Test that a user write drops cached listings."""
+        cached_user_tools.client.delete = AsyncMock(return_value=True)
+
+        await cached_user_tools.list_custom_users()
+        await cached_user_tools.delete_user("alice")
+        await cached_user_tools.list_custom_users()
+
+        assert cached_user_tools.client.get.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_write_in_another_instance_invalidates_cache(
+        self, cached_user_tools, make_tools
+    ):
+        """Test that entries are shared and invalidated across tool instances."""
+        other = make_tools(UserTools, enable_cache=True)
+        other.client.get = AsyncMock(return_value=[{"id": 1, "username": "alice"}])
+        other.client.delete = AsyncMock(return_value=True)
+
+        await cached_user_tools.list_custom_users()
+        await other.list_custom_users()
+        other.client.get.assert_not_awaited()
+
+        await other.delete_user("alice")
+        await cached_user_tools.list_custom_users()
+
+        assert cached_user_tools.client.get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_cached(self, cached_user_tools):
+        """Test that an error response is fetched again on the next call."""
+        cached_user_tools.client.get = AsyncMock(return_value=[])
+
+        await cached_user_tools.get_user("nobody")
+        await cached_user_tools.get_user("nobody")
+
+        assert cached_user_tools.client.get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_one_request(self, cached_user_tools):
+        """Test that concurrent identical lookups coalesce into one request."""
+        results = await asyncio.gather(
+            *(cached_user_tools.get_user("alice") for _ in range(5))
+        )
+
+        cached_user_tools.client.get.assert_awaited_once_with("/user", params={"username": "alice"})
+        assert all(r == results[0] for r in results)
+        assert decorators._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_write_during_fetch_discards_stale_result(self, cached_user_tools):
+        """Test that a listing in flight across a write is neither cached nor shared."""
+        release = asyncio.Event()
+        listings = [[{"id": 1, "username": "alice"}], []]
+
+        async def get(endpoint, params=None):
+            if params == {"username": "alice"}:
+                return [{"id": 1, "username": "alice"}]
+            users = listings.pop(0)
+            if users:
+                await release.wait()
+            return users
+
+        cached_user_tools.client.get = AsyncMock(side_effect=get)
+        cached_user_tools.client.delete = AsyncMock(return_value=True)
+
+        stale = asyncio.ensure_future(cached_user_tools.list_custom_users())
+        await asyncio.sleep(0)
+        await cached_user_tools.delete_user("alice")
+
+        # Bounded so a call that joins the stale fetch fails instead of hanging
+        fresh = await asyncio.wait_for(cached_user_tools.list_custom_users(), timeout=1)
+        release.set()
+        await stale
+
+        assert fresh["users"] == []
+        assert (await cached_user_tools.list_custom_users())["users"] == []
+        assert decorators._inflight == {}
@@ -1,6 +1,13 @@
 """Caching layer for TrueNAS MCP Server."""
 
-from .manager import CacheManager, get_cache_manager
-from .decorators import cached
+from .manager import CacheManager, get_cache_manager, hash_key
+from .decorators import cached, cache_invalidate, conditional_cache
 
-__all__ = ["CacheManager", "get_cache_manager", "cached"]
+__all__ = [
+    "CacheManager",
+    "get_cache_manager",
+    "hash_key",
+    "cached",
+    "cache_invalidate",
+    "conditional_cache",
+]
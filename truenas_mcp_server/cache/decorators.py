@@ -1,29 +1,98 @@
 """Cache decorators for easy caching of function results."""
 
 import asyncio
+import copy
 import functools
 import logging
-from typing import Any, Callable, Optional
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
 
-from .manager import get_cache_manager
+from .manager import CacheManager, get_cache_manager, hash_key
 
 logger = logging.getLogger(__name__)
 
+# Misses currently being computed, keyed by (namespace, cache key)
+_inflight: Dict[Tuple[Optional[str], str], asyncio.Future] = {}
+
+# Bumped by every invalidation, so a miss that was computing across a write
+# knows its result may be stale and must not be stored
+_generations: Dict[Optional[str], int] = {}
+
+
+def _invalidate_inflight(namespace: Optional[str], key: Optional[str] = None) -> None:
+    """Detach in-flight misses in ``namespace`` so later calls fetch afresh"""
+    _generations[namespace] = _generations.get(namespace, 0) + 1
+    for inflight_key in list(_inflight):
+        if inflight_key[0] == namespace and (key is None or inflight_key[1] == key):
+            del _inflight[inflight_key]
+
+
+async def _get_or_compute(
+    cache: CacheManager,
+    cache_key: str,
+    namespace: Optional[str],
+    ttl: Optional[int],
+    compute: Callable[[], Awaitable[Any]],
+    condition: Optional[Callable[[Any], bool]],
+) -> Any:
+    """
+    Return a cached value, computing and storing it on a miss.
+
+    Concurrent misses for the same key share one computation. Every caller
+    gets its own deep copy, so mutating a result never alters the cached
+    entry or another caller's result. A result is not stored if the
+    namespace was invalidated while it was being computed.
+    """
+    cached_value = await cache.get(cache_key, namespace=namespace)
+    if cached_value is not None:
+        logger.debug(f"Cache hit: {cache_key}")
+        return copy.deepcopy(cached_value)
+
+    inflight_key = (namespace, cache_key)
+    pending = _inflight.get(inflight_key)
+    if pending is None:
+        logger.debug(f"Cache miss: {cache_key}")
+        generation = _generations.get(namespace, 0)
+
+        async def fetch() -> Any:
+            result = await compute()
+            if _generations.get(namespace, 0) != generation:
+                logger.debug(f"Not caching {cache_key}: invalidated during fetch")
+            elif condition is None or condition(result):
+                await cache.set(cache_key, copy.deepcopy(result), ttl=ttl, namespace=namespace)
+            return result
+
+        def forget(future: asyncio.Future) -> None:
+            # Invalidation may already have replaced this entry with a newer miss
+            if _inflight.get(inflight_key) is future:
+                del _inflight[inflight_key]
+
+        pending = asyncio.ensure_future(fetch())
+        _inflight[inflight_key] = pending
+        pending.add_done_callback(forget)
+
+    # Shielded so one caller's cancellation doesn't fail the others
+    return copy.deepcopy(await asyncio.shield(pending))
+
 
 def cached(
     ttl: Optional[int] = None,
     namespace: Optional[str] = None,
     key_func: Optional[Callable] = None,
     enabled: bool = True,
+    condition: Optional[Callable[[Any], bool]] = None,
 ):
     """
     Decorator to cache async function results.
 
+    Callers receive copies of cached results, and concurrent misses for the
+    same key share a single call of the wrapped function.
+
     Args:
         ttl: Cache TTL in seconds (uses manager default if not provided)
         namespace: Cache namespace for grouping related entries
         key_func: Optional function to generate cache key from args/kwargs
         enabled: Whether caching is enabled (useful for conditional caching)
+        condition: Optional predicate on the result; results failing it are not cached
 
     Example:
         @cached(ttl=300, namespace="pools")
@@ -50,23 +119,11 @@ def cached(
                 cache_key = key_func(*args, **kwargs)
             else:
                 # Default: hash function name + arguments
-                cache_key = cache._hash_key(func.__name__, *args, **kwargs)
-
-            # Try to get from cache
-            cached_value = await cache.get(cache_key, namespace=namespace)
-
-            if cached_value is not None:
-                logger.debug(f"Cache hit for {func.__name__}: {cache_key}")
-                return cached_value
-
-            # Cache miss - call function
-            logger.debug(f"Cache miss for {func.__name__}: {cache_key}")
-            result = await func(*args, **kwargs)
+                cache_key = hash_key(func.__name__, *args, **kwargs)
 
-            # Store in cache
-            await cache.set(cache_key, result, ttl=ttl, namespace=namespace)
-
-            return result
+            return await _get_or_compute(
+                cache, cache_key, namespace, ttl, lambda: func(*args, **kwargs), condition
+            )
 
         # Add cache control methods
         wrapper.cache_clear = lambda: asyncio.create_task(
@@ -83,6 +140,9 @@ def cache_invalidate(namespace: str, key: Optional[str] = None):
     """
     Decorator to invalidate cache after function execution.
 
+    Misses still in flight for the namespace are detached too, so their
+    (possibly stale) results are neither stored nor shared with later calls.
+
     Args:
         namespace: Cache namespace to invalidate
         key: Specific key to invalidate (if None, clears entire namespace)
@@ -100,6 +160,7 @@ def cache_invalidate(namespace: str, key: Optional[str] = None):
             result = await func(*args, **kwargs)
 
             # Invalidate cache
+            _invalidate_inflight(namespace, key)
             cache = get_cache_manager()
             if key:
                 await cache.delete(key, namespace=namespace)
@@ -129,30 +190,4 @@ def conditional_cache(condition_func: Callable[[Any], bool], **cache_kwargs):
         async def api_call():
             return await make_request()
     """
-
-    def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        async def wrapper(*args, **kwargs) -> Any:
-            cache = get_cache_manager()
-            cache_key = cache._hash_key(func.__name__, *args, **kwargs)
-            namespace = cache_kwargs.get("namespace")
-
-            # Try cache first
-            cached_value = await cache.get(cache_key, namespace=namespace)
-            if cached_value is not None:
-                return cached_value
-
-            # Call function
-            result = await func(*args, **kwargs)
-
-            # Cache only if condition is met
-            if condition_func(result):
-                ttl = cache_kwargs.get("ttl")
-                await cache.set(cache_key, result, ttl=ttl, namespace=namespace)
-                logger.debug(f"Conditionally cached result for {func.__name__}")
-
-            return result
-
-        return wrapper
-
-    return decorator
+    return cached(condition=condition_func, **cache_kwargs)
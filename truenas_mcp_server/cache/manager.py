@@ -12,6 +12,25 @@ from dataclasses import dataclass, field
 logger = logging.getLogger(__name__)
 
 
+def hash_key(*args, **kwargs) -> str:
+    """
+    Generate cache key from function arguments.
+
+    Args:
+        *args: Positional arguments
+        **kwargs: Keyword arguments
+
+    Returns:
+        Hash of arguments as cache key
+    """
+    key_data = {
+        "args": args,
+        "kwargs": sorted(kwargs.items()),
+    }
+    key_str = json.dumps(key_data, sort_keys=True, default=str)
+    return hashlib.md5(key_str.encode()).hexdigest()
+
+
 @dataclass
 class CacheEntry:
     """Cache entry with value and metadata."""
@@ -146,24 +165,6 @@ class CacheManager:
             return f"{namespace}:{key}"
         return key
 
-    def _hash_key(self, *args, **kwargs) -> str:
-        """
-        Generate cache key from function arguments.
-
-        Args:
-            *args: Positional arguments
-            **kwargs: Keyword arguments
-
-        Returns:
-            Hash of arguments as cache key
-        """
-        key_data = {
-            "args": args,
-            "kwargs": sorted(kwargs.items()),
-        }
-        key_str = json.dumps(key_data, sort_keys=True, default=str)
-        return hashlib.md5(key_str.encode()).hexdigest()
-
     async def get(
         self, key: str, namespace: Optional[str] = None, default: Any = None
     ) -> Optional[Any]:
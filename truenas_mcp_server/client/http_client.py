@@ -3,8 +3,10 @@ HTTP Client implementation with connection pooling, retry logic, and logging
 """
 
 import asyncio
+import importlib.util
+import json
 import logging
-from typing import Optional, Dict, Any, Union
+from typing import Optional, Dict, Any, AsyncIterator, List, Union
 from functools import wraps
 from enum import Enum
 import httpx
@@ -21,6 +23,57 @@ from ..exceptions import (
 )
 
 
+try:
+    import orjson
+except ImportError:  # optional speedup: pip install truenas-mcp-server[speedups]
+    orjson = None
+
+if orjson is not None:
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+else:
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+
+try:
+    import ijson
+except ImportError:  # optional speedup: pip install truenas-mcp-server[speedups]
+    ijson = None
+
+
+class _AsyncByteReader:
+    """Adapt an async byte iterator to the async read() ijson consumes"""
+
+    def __init__(self, chunks: AsyncIterator[bytes]):
+        self._chunks = chunks.__aiter__()
+        self._buffer = b""
+
+    async def read(self, size: int = -1) -> bytes:
+        # ijson probes with read(0) to detect bytes vs. str
+        while size != 0 and not self._buffer:
+            try:
+                self._buffer = await self._chunks.__anext__()
+            except StopAsyncIteration:
+                break
+        if size < 0:
+            size = len(self._buffer)
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+# httpx only speaks HTTP/2 with h2 installed; without it we stay on
+# HTTP/1.1 keep-alive connections
+_H2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def _encode_body(data: Any) -> Optional[bytes]:
+    """Serialize a request body; None sends no body, like httpx's json=None"""
+    return None if data is None else _dumps(data)
+
+
 class TrueNASVariant(str, Enum):
     """TrueNAS product variant"""
     CORE = "core"       # TrueNAS Core (FreeBSD-based)
@@ -103,14 +156,17 @@ class TrueNASClient:
     Provides connection pooling, retry logic, and proper error handling
     """
     
-    def __init__(self, settings=None):
+    def __init__(self, settings=None, transport: Optional[httpx.AsyncBaseTransport] = None):
         """
         Initialize the TrueNAS client
 
         Args:
             settings: Optional Settings instance (uses get_settings() if not provided)
+            transport: Optional httpx transport to use instead of the pooled
+                HTTP transport (e.g. httpx.MockTransport in tests)
         """
         self.settings = settings or get_settings()
+        self._transport = transport
         self._client = None
         self._request_count = 0
         self._error_count = 0
@@ -130,12 +186,15 @@ class TrueNASClient:
     async def connect(self):
         """Initialize the HTTP client"""
         if self._client is None:
-            transport = httpx.AsyncHTTPTransport(
+            # httpx ignores the client's verify= once a transport is given
+            transport = self._transport or httpx.AsyncHTTPTransport(
+                verify=self.settings.truenas_verify_ssl,
                 retries=0,  # We handle retries ourselves
+                http2=self.settings.http2 and _H2_AVAILABLE,
                 limits=httpx.Limits(
                     max_connections=self.settings.http_pool_connections,
                     max_keepalive_connections=self.settings.http_pool_maxsize,
-                    keepalive_expiry=30.0
+                    keepalive_expiry=self.settings.http_keepalive_expiry
                 )
             )
             
@@ -145,7 +204,8 @@ class TrueNASClient:
                 verify=self.settings.truenas_verify_ssl,
                 timeout=httpx.Timeout(self.settings.http_timeout),
                 transport=transport,
-                follow_redirects=True
+                follow_redirects=True,
+                event_hooks={"response": [self._check_response]}
             )
             
             logger.info(f"Connected to TrueNAS at {self.settings.truenas_url}")
@@ -186,34 +246,43 @@ class TrueNASClient:
         logger.debug(f"Response: {response.status_code} ({response.elapsed.total_seconds():.2f}s)")
         if self.settings.log_level == "DEBUG" and response.content:
             try:
-                logger.debug(f"Response body: {response.json()}")
+                logger.debug(f"Response body: {_loads(response.content)}")
             except:
                 pass  # Not JSON response
     
+    async def _check_response(self, response: Response):
+        """Response event hook raising TrueNAS exceptions for error statuses"""
+        if response.status_code >= 400:
+            # Hooks run before the body is read, also for streamed requests
+            await response.aread()
+            self._log_response(response)
+            self._handle_error_response(response)
+    
     def _handle_error_response(self, response: Response):
         """Handle error responses from the API"""
         status_code = response.status_code
         
         try:
-            error_data = response.json()
+            error_data = _loads(response.content)
             error_message = error_data.get("message", response.text)
         except:
             error_message = response.text
         
         self._error_count += 1
+        details = {"status_code": status_code}
         
         if status_code == 401:
-            raise TrueNASAuthenticationError(f"Authentication failed: {error_message}")
+            raise TrueNASAuthenticationError(f"Authentication failed: {error_message}", details)
         elif status_code == 403:
-            raise TrueNASAuthenticationError(f"Permission denied: {error_message}")
+            raise TrueNASAuthenticationError(f"Permission denied: {error_message}", details)
         elif status_code == 429:
-            raise TrueNASRateLimitError(f"Rate limit exceeded: {error_message}")
+            raise TrueNASRateLimitError(f"Rate limit exceeded: {error_message}", details)
         elif 400 <= status_code < 500:
-            raise TrueNASAPIError(f"Client error ({status_code}): {error_message}")
+            raise TrueNASAPIError(f"Client error ({status_code}): {error_message}", details)
         elif 500 <= status_code < 600:
-            raise TrueNASAPIError(f"Server error ({status_code}): {error_message}")
+            raise TrueNASAPIError(f"Server error ({status_code}): {error_message}", details)
         else:
-            raise TrueNASAPIError(f"Unexpected status ({status_code}): {error_message}")
+            raise TrueNASAPIError(f"Unexpected status ({status_code}): {error_message}", details)
     
     @retry_on_failure()
     async def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -233,10 +302,7 @@ class TrueNASClient:
         response = await self._client.get(endpoint, params=params)
         self._log_response(response)
         
-        if response.status_code >= 400:
-            self._handle_error_response(response)
-        
-        return response.json()
+        return _loads(response.content)
     
     @retry_on_failure()
     async def post(self, endpoint: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -253,13 +319,10 @@ class TrueNASClient:
         await self.ensure_connected()
         
         self._log_request("POST", endpoint, json=data)
-        response = await self._client.post(endpoint, json=data)
+        response = await self._client.post(endpoint, content=_encode_body(data))
         self._log_response(response)
         
-        if response.status_code >= 400:
-            self._handle_error_response(response)
-        
-        return response.json()
+        return _loads(response.content)
     
     @retry_on_failure()
     async def put(self, endpoint: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -276,13 +339,10 @@ class TrueNASClient:
         await self.ensure_connected()
         
         self._log_request("PUT", endpoint, json=data)
-        response = await self._client.put(endpoint, json=data)
+        response = await self._client.put(endpoint, content=_encode_body(data))
         self._log_response(response)
         
-        if response.status_code >= 400:
-            self._handle_error_response(response)
-        
-        return response.json()
+        return _loads(response.content)
     
     @retry_on_failure()
     async def post_raw(
@@ -319,14 +379,11 @@ class TrueNASClient:
         )
         self._log_response(response)
 
-        if response.status_code >= 400:
-            self._handle_error_response(response)
-
         # Handle empty responses
         if not response.content:
             return {}
 
-        return response.json()
+        return _loads(response.content)
 
     @retry_on_failure()
     async def delete(self, endpoint: str) -> bool:
@@ -345,11 +402,88 @@ class TrueNASClient:
         response = await self._client.delete(endpoint)
         self._log_response(response)
         
-        if response.status_code >= 400:
-            self._handle_error_response(response)
-        
         return response.status_code < 300
+
+    @retry_on_failure()
+    async def _open_stream(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Response:
+        """Send a GET request and return the response with its body unread"""
+        await self.ensure_connected()
+        
+        self._log_request("GET", endpoint, params=params)
+        request = self._client.build_request("GET", endpoint, params=params)
+        return await self._client.send(request, stream=True)
+    
+    async def iter_items(
+        self, endpoint: str, params: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Any]:
+        """
+        Yield the elements of a JSON array response one at a time
+        
+        With ijson installed the body is parsed as it arrives, so large
+        listings such as /user or /pool/dataset are never held in memory as
+        a whole; otherwise the body is read and decoded in one go.
+        
+        Args:
+            endpoint: API endpoint (relative to base URL)
+            params: Optional query parameters
+            
+        Yields:
+            Decoded array elements
+        """
+        response = await self._open_stream(endpoint, params)
+        try:
+            if ijson is None:
+                for item in _loads(await response.aread()):
+                    yield item
+            else:
+                reader = _AsyncByteReader(response.aiter_bytes())
+                async for item in ijson.items(reader, "item", use_float=True):
+                    yield item
+        finally:
+            await response.aclose()
+            logger.debug(f"Response: {response.status_code} (streamed)")
     
+    async def batch(self, requests: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Send several API requests concurrently over the shared connection pool
+
+        The TrueNAS REST API has no heterogeneous batch endpoint, so each item
+        is still its own HTTP request, but all of them are in flight at once
+        and the caller pays roughly one round-trip instead of N.
+
+        Args:
+            requests: List of request specs, e.g.
+                [{"method": "GET", "url": "/system/info"},
+                 {"method": "POST", "url": "/filesystem/stat", "data": {"path": "/mnt"}}]
+
+        Returns:
+            List of responses in the same order as ``requests``. A failed item
+            is returned as its exception instead of aborting the whole batch.
+        """
+        # Reject bad specs before creating any coroutine, so none is left un-awaited
+        methods = [spec.get("method", "GET").upper() for spec in requests]
+        for method, spec in zip(methods, requests):
+            if method not in ("GET", "POST", "PUT", "DELETE"):
+                raise ValueError(f"Unsupported batch method: {method}")
+            if not spec.get("url"):
+                raise ValueError(f"Batch request is missing a url: {spec!r}")
+
+        await self.ensure_connected()
+
+        calls = []
+        for method, spec in zip(methods, requests):
+            url = spec["url"]
+            if method == "GET":
+                calls.append(self.get(url, params=spec.get("params")))
+            elif method == "POST":
+                calls.append(self.post(url, spec.get("data")))
+            elif method == "PUT":
+                calls.append(self.put(url, spec.get("data")))
+            else:
+                calls.append(self.delete(url))
+
+        return list(await asyncio.gather(*calls, return_exceptions=True))
+
     def get_stats(self) -> Dict[str, int]:
         """Get client statistics"""
         return {
@@ -432,19 +566,27 @@ class TrueNASClient:
 
 # Global client instance
 _client: Optional[TrueNASClient] = None
+_client_lock = asyncio.Lock()
 
 
 async def get_client() -> TrueNASClient:
     """
     Get or create the global TrueNAS client instance
     
+    Once the client exists this returns it without locking; concurrent
+    first calls serialize on a lock so only one client is built.
+    
     Returns:
         TrueNASClient instance
     """
     global _client
-    if _client is None:
-        _client = TrueNASClient()
-        await _client.connect()
+    if _client is not None:
+        return _client
+    async with _client_lock:
+        if _client is None:
+            client = TrueNASClient()
+            await client.connect()
+            _client = client
     return _client
 
 
@@ -78,13 +78,23 @@ class Settings(BaseSettings):
     )
     
     http_pool_connections: int = Field(
-        default=10,
-        description="Number of connection pool connections"
+        default=64,
+        description="Maximum number of concurrent connections to TrueNAS"
     )
     
     http_pool_maxsize: int = Field(
-        default=20,
-        description="Maximum size of the connection pool"
+        default=32,
+        description="Maximum number of idle keep-alive connections kept in the pool"
+    )
+    
+    http_keepalive_expiry: float = Field(
+        default=60.0,
+        description="Seconds an idle pooled connection is kept alive"
+    )
+    
+    http2: bool = Field(
+        default=True,
+        description="Negotiate HTTP/2 with TrueNAS when the h2 package is installed"
     )
     
     # Rate Limiting
@@ -103,6 +113,22 @@ class Settings(BaseSettings):
         description="Rate limit window in seconds",
     )
     
+    # Caching
+    enable_cache: bool = Field(
+        default=True,
+        description="Cache results of read-only tools",
+    )
+    
+    cache_ttl: int = Field(
+        default=300,
+        description="Default cache TTL in seconds",
+    )
+    
+    cache_max_size: int = Field(
+        default=1000,
+        description="Maximum number of cached results per tool group",
+    )
+    
     # Feature Flags
     enable_debug_tools: bool = Field(
         default=False,
@@ -131,7 +157,8 @@ class Settings(BaseSettings):
     @property
     def api_base_url(self) -> str:
         """Get the full API base URL"""
-        return f"{self.truenas_url}/api/v2.0"
+        # HttpUrl renders a bare host with a trailing slash
+        return f"{str(self.truenas_url).rstrip('/')}/api/v2.0"
     
     @property
     def headers(self) -> Dict[str, str]:
@@ -161,7 +188,10 @@ class Settings(BaseSettings):
         "case_sensitive": False,
         "extra": "ignore",
         "use_enum_values": True,
-        "populate_by_name": True
+        "populate_by_name": True,
+        # Settings are read on every request and never written after load;
+        # derive variants with model_copy(update=...) instead
+        "frozen": True
     }
 
 
@@ -7,6 +7,7 @@ to a SCALE system.
 """
 
 import sys
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from typing import Optional, List, Type
@@ -194,6 +195,7 @@ class TrueNASMCPServer:
         when asyncio.run() is called separately.
         """
         logger.info(f"Starting {self.name}...")
+        _install_uvloop()
 
         try:
             self.mcp.run()
@@ -204,6 +206,16 @@ class TrueNASMCPServer:
             raise
 
 
+def _install_uvloop() -> None:
+    """Use uvloop for the server's event loop when it is installed"""
+    try:
+        import uvloop
+    except ImportError:  # optional speedup, unavailable on Windows
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.debug("Using uvloop event loop")
+
+
 def create_server(name: Optional[str] = None) -> TrueNASMCPServer:
     """
     Factory function to create a TrueNAS MCP Server instance
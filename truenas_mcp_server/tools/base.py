@@ -3,10 +3,11 @@ Base class and utilities for MCP tools
 """
 
 import logging
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import Any, Dict, List, Optional, Callable, Tuple
 from abc import ABC, abstractmethod
 
+from ..cache import cache_invalidate, cached, hash_key
 from ..client import TrueNASClient
 from ..config import Settings
 from ..exceptions import TrueNASError
@@ -63,6 +64,110 @@ def tool_handler(func: Callable) -> Callable:
     return wrapper
 
 
+def _is_cacheable(result: Any) -> bool:
+    """Whether a tool result may be cached; {"success": False} results are not"""
+    return not (isinstance(result, dict) and result.get("success") is False)
+
+
+def cached_tool(ttl: int, namespace: str) -> Callable:
+    """
+    Decorator caching a read-only tool's result in the global cache manager
+
+    Built on cache.decorators.cached. Entries are keyed by tool method and
+    arguments rather than tool instance, so @invalidates_cache on any tool
+    clears them. Apply beneath @tool_handler so that failures, which surface
+    as exceptions, are never stored; neither are {"success": False}
+    results. Caching is skipped when settings.enable_cache is off.
+
+    Args:
+        ttl: Seconds a result stays fresh
+        namespace: Cache namespace shared with the invalidating write tools
+    """
+    def decorator(func: Callable) -> Callable:
+        qualname = func.__qualname__
+        cached_func = cached(
+            ttl=ttl,
+            namespace=namespace,
+            key_func=lambda self, *args, **kwargs: hash_key(qualname, *args, **kwargs),
+            condition=_is_cacheable,
+        )(func)
+
+        @wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            await self.ensure_initialized()
+            if not self.settings.enable_cache:
+                return await func(self, *args, **kwargs)
+            return await cached_func(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def invalidates_cache(*namespaces: str) -> Callable:
+    """
+    Decorator clearing cached read results after a write
+
+    Args:
+        *namespaces: Cache namespaces affected by the write
+    """
+    def decorator(func: Callable) -> Callable:
+        invalidating_func = func
+        for namespace in namespaces:
+            invalidating_func = cache_invalidate(namespace)(invalidating_func)
+
+        @wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            await self.ensure_initialized()
+            if not self.settings.enable_cache:
+                return await func(self, *args, **kwargs)
+            return await invalidating_func(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+# Pools, disks and quotas repeat a small set of sizes, and both helpers are
+# pure, so results are memoized at module level rather than per tool instance.
+@lru_cache(maxsize=1024)
+def _format_size(size_bytes: int) -> str:
+    """Format bytes as a human-readable size string"""
+    for unit in ['B', 'KB', 'MB', 'GB', 'TB', 'PB']:
+        if size_bytes < 1024.0:
+            return f"{size_bytes:.2f} {unit}"
+        size_bytes /= 1024.0
+    return f"{size_bytes:.2f} EB"
+
+
+_SIZE_MULTIPLIERS = {
+    'K': 1024,
+    'M': 1024**2,
+    'G': 1024**3,
+    'T': 1024**4,
+    'P': 1024**5,
+}
+
+
+@lru_cache(maxsize=1024)
+def _parse_size(size_str: str) -> int:
+    """Parse a human-readable size string (e.g. "10G", "500M") to bytes"""
+    size_str = size_str.upper().strip()
+
+    # "10GB" and "10G" are the same size; a bare "B" or no unit means bytes
+    number_str = size_str[:-1] if size_str.endswith('B') else size_str
+    multiplier = _SIZE_MULTIPLIERS.get(number_str[-1:])
+    if multiplier is None:
+        multiplier = 1
+    else:
+        number_str = number_str[:-1]
+
+    try:
+        return int(float(number_str.strip()) * multiplier)
+    except ValueError:
+        raise ValueError(f"Invalid size format: {size_str}")
+
+
 class BaseTool(ABC):
     """
     Base class for all MCP tools
@@ -131,11 +236,7 @@ class BaseTool(ABC):
         Returns:
             Human-readable size string
         """
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB', 'PB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.2f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.2f} EB"
+        return _format_size(size_bytes)
     
     def parse_size(self, size_str: str) -> int:
         """
@@ -147,39 +248,7 @@ class BaseTool(ABC):
         Returns:
             Size in bytes
         """
-        units = {
-            'B': 1,
-            'K': 1024,
-            'KB': 1024,
-            'M': 1024**2,
-            'MB': 1024**2,
-            'G': 1024**3,
-            'GB': 1024**3,
-            'T': 1024**4,
-            'TB': 1024**4,
-            'P': 1024**5,
-            'PB': 1024**5
-        }
-        
-        size_str = size_str.upper().strip()
-        
-        # Find the unit
-        unit = None
-        for u in sorted(units.keys(), key=len, reverse=True):
-            if size_str.endswith(u):
-                unit = u
-                number_str = size_str[:-len(u)].strip()
-                break
-        
-        if unit is None:
-            # No unit specified, assume bytes
-            return int(float(size_str))
-        
-        try:
-            number = float(number_str)
-            return int(number * units[unit])
-        except ValueError:
-            raise ValueError(f"Invalid size format: {size_str}")
+        return _parse_size(size_str)
     
     def validate_required_fields(self, data: Dict[str, Any], required: list) -> bool:
         """
@@ -220,15 +289,34 @@ class BaseTool(ABC):
         # Cap limit at MAX_LIMIT
         limit = min(limit, self.MAX_LIMIT)
 
-        total = len(items)
         paginated = items[offset:offset + limit]
+        pagination = self.pagination_metadata(len(items), limit, offset, len(paginated))
+
+        return paginated, pagination
+
+    def pagination_metadata(
+        self,
+        total: int,
+        limit: int,
+        offset: int,
+        returned: int
+    ) -> Dict[str, Any]:
+        """
+        Build pagination metadata for a page taken from a stream of items
 
-        pagination = {
+        Args:
+            total: Total number of items seen
+            limit: Page size, already capped at MAX_LIMIT
+            offset: Number of items skipped
+            returned: Number of items in the page
+
+        Returns:
+            Pagination metadata in the shape apply_pagination returns
+        """
+        return {
             "total": total,
             "limit": limit,
             "offset": offset,
-            "returned": len(paginated),
+            "returned": returned,
             "has_more": offset + limit < total
-        }
-
-        return paginated, pagination
\ No newline at end of file
+        }
\ No newline at end of file
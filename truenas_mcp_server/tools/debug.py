@@ -2,7 +2,6 @@
 Debug tools for TrueNAS MCP Server
 """
 
-import os
 from typing import Dict, Any
 from .base import BaseTool, tool_handler
 
@@ -28,9 +27,10 @@ class DebugTools(BaseTool):
         """
         await self.ensure_initialized()
         
-        # Mask sensitive data
+        # Mask sensitive data; the leading characters of a TrueNAS key are
+        # its ID and the start of the secret, so only the tail is shown
         api_key = self.settings.truenas_api_key.get_secret_value()
-        masked_key = f"{api_key[:8]}...{api_key[-4:]}" if len(api_key) > 12 else "***"
+        masked_key = f"...{api_key[-4:]}" if len(api_key) > 12 else "***"
         
         return {
             "success": True,
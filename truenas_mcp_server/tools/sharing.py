@@ -3,7 +3,7 @@ Sharing tools for TrueNAS (SMB, NFS, iSCSI)
 """
 
 from typing import Dict, Any, List, Optional
-from .base import BaseTool, tool_handler
+from .base import BaseTool, cached_tool, invalidates_cache, tool_handler
 
 
 class SharingTools(BaseTool):
@@ -55,6 +55,7 @@ class SharingTools(BaseTool):
     # SMB Share Management
     
     @tool_handler
+    @cached_tool(ttl=30, namespace="smb_shares")
     async def list_smb_shares(
         self,
         limit: int = BaseTool.DEFAULT_LIMIT,
@@ -118,6 +119,7 @@ class SharingTools(BaseTool):
         }
     
     @tool_handler
+    @invalidates_cache("smb_shares")
     async def create_smb_share(
         self,
         path: str,
@@ -183,6 +185,7 @@ class SharingTools(BaseTool):
         }
     
     @tool_handler
+    @invalidates_cache("smb_shares")
     async def delete_smb_share(self, share_name: str) -> Dict[str, Any]:
         """
         Delete an SMB share
@@ -340,8 +343,7 @@ class SharingTools(BaseTool):
         created = await self.client.post("/sharing/nfs", export_data)
         
         # Generate example mount command
-        server_ip = str(self.settings.truenas_url).replace("https://", "").replace("http://", "").split(":")[0]
-        mount_example = f"mount -t nfs {server_ip}:{path} /local/mount/point"
+        mount_example = f"mount -t nfs {self.settings.truenas_url.host}:{path} /local/mount/point"
         
         return {
             "success": True,
@@ -42,6 +42,11 @@ class SnapshotTools(BaseTool):
               "schedule": {"type": "object", "required": True},
               "retention": {"type": "integer", "required": True},
               "recursive": {"type": "boolean", "required": False}}),
+            ("create_snapshot_tasks", self.create_snapshot_tasks,
+             "Submit several automated snapshot tasks as one background job; "
+             "check the returned job_id for per-task results",
+             {"tasks": {"type": "array", "required": True,
+                        "description": "List of task specs with the create_snapshot_task arguments"}}),
         ]
     
     @tool_handler
@@ -401,6 +406,97 @@ class SnapshotTools(BaseTool):
         """
         await self.ensure_initialized()
         
+        task_data = self._build_task_data(
+            dataset, schedule, retention, retention_unit, naming_schema, recursive, enabled
+        )
+        
+        created = await self.client.post("/pool/snapshottask", task_data)
+        
+        return {
+            "success": True,
+            "message": f"Snapshot task created for dataset '{dataset}'",
+            "task": {
+                "id": created.get("id"),
+                "dataset": dataset,
+                "schedule": self._format_schedule(schedule),
+                "retention": f"{retention} {retention_unit}(S)",
+                "enabled": enabled
+            }
+        }
+    
+    @tool_handler
+    async def create_snapshot_tasks(self, tasks: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Create several automated snapshot tasks in one request
+        
+        The tasks are submitted as a single core.bulk job instead of one
+        POST per dataset, whatever their number. Creation is asynchronous:
+        success only means TrueNAS accepted the job, and each task's outcome
+        must be read from the job (e.g. /core/get_jobs?id=<job_id>).
+        
+        Args:
+            tasks: List of task specs, each taking the create_snapshot_task arguments
+            
+        Returns:
+            Dictionary containing the bulk job ID and the datasets submitted
+        """
+        await self.ensure_initialized()
+        
+        if not tasks:
+            return {
+                "success": False,
+                "error": "No snapshot tasks given"
+            }
+        
+        # Check every spec before submitting any, so a bad one fails the whole call
+        for index, spec in enumerate(tasks, start=1):
+            missing = [key for key in ("dataset", "schedule", "retention") if spec.get(key) is None]
+            if missing:
+                return {
+                    "success": False,
+                    "error": f"Snapshot task {index} is missing required fields: {', '.join(missing)}"
+                }
+        
+        params = [
+            [self._build_task_data(
+                spec["dataset"],
+                spec["schedule"],
+                spec["retention"],
+                spec.get("retention_unit", "DAY"),
+                spec.get("naming_schema"),
+                spec.get("recursive", True),
+                spec.get("enabled", True)
+            )]
+            for spec in tasks
+        ]
+        
+        job_id = await self.client.post(
+            "/core/bulk",
+            {"method": "pool.snapshottask.create", "params": params}
+        )
+        
+        return {
+            "success": True,
+            "status": "submitted",
+            "message": (
+                f"Submitted {len(params)} snapshot tasks as job {job_id}; creation runs "
+                "in the background, so check the job for each task's result"
+            ),
+            "job_id": job_id,
+            "datasets": [spec["dataset"] for spec in tasks]
+        }
+    
+    def _build_task_data(
+        self,
+        dataset: str,
+        schedule: Dict[str, str],
+        retention: int,
+        retention_unit: str,
+        naming_schema: Optional[str],
+        recursive: bool,
+        enabled: bool
+    ) -> Dict[str, Any]:
+        """Build the pool.snapshottask.create payload for one task"""
         # Default naming schema
         if not naming_schema:
             naming_schema = "auto-%Y%m%d-%H%M%S"
@@ -411,7 +507,7 @@ class SnapshotTools(BaseTool):
             if key not in schedule:
                 schedule[key] = "*"
         
-        task_data = {
+        return {
             "dataset": dataset,
             "recursive": recursive,
             "lifetime_value": retention,
@@ -421,20 +517,6 @@ class SnapshotTools(BaseTool):
             "enabled": enabled,
             "allow_empty": True
         }
-        
-        created = await self.client.post("/pool/snapshottask", task_data)
-        
-        return {
-            "success": True,
-            "message": f"Snapshot task created for dataset '{dataset}'",
-            "task": {
-                "id": created.get("id"),
-                "dataset": dataset,
-                "schedule": self._format_schedule(schedule),
-                "retention": f"{retention} {retention_unit}(S)",
-                "enabled": enabled
-            }
-        }
     
     def _format_schedule(self, schedule: Dict[str, str]) -> str:
         """Format cron schedule as human-readable string"""
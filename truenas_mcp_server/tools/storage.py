@@ -2,8 +2,11 @@
 Storage management tools for TrueNAS
 """
 
+from contextlib import aclosing
 from typing import Dict, Any, Optional, List
-from .base import BaseTool, tool_handler
+from urllib.parse import quote
+from .base import BaseTool, cached_tool, invalidates_cache, tool_handler
+from ..exceptions import TrueNASAPIError
 
 
 class StorageTools(BaseTool):
@@ -18,7 +21,8 @@ class StorageTools(BaseTool):
               "offset": {"type": "integer", "required": False,
                         "description": "Items to skip for pagination"}}),
             ("get_pool_status", self.get_pool_status, "Get detailed status of a specific pool",
-             {"pool_name": {"type": "string", "required": True}}),
+             {"pool_name": {"type": "string", "required": True,
+                            "description": "Pool name, or numeric pool ID"}}),
             ("list_datasets", self.list_datasets, "List all datasets",
              {"limit": {"type": "integer", "required": False,
                        "description": "Max items to return (default: 100, max: 500)"},
@@ -45,6 +49,7 @@ class StorageTools(BaseTool):
         ]
     
     @tool_handler
+    @cached_tool(ttl=15, namespace="pools")
     async def list_pools(self, limit: int = 100, offset: int = 0) -> Dict[str, Any]:
         """
         List all storage pools
@@ -111,34 +116,25 @@ class StorageTools(BaseTool):
         }
     
     @tool_handler
+    @cached_tool(ttl=10, namespace="pools")
     async def get_pool_status(self, pool_name: str) -> Dict[str, Any]:
         """
         Get detailed status of a specific pool
         
         Args:
-            pool_name: Name of the pool
+            pool_name: Name of the pool, or its numeric pool ID
             
         Returns:
             Dictionary containing detailed pool status
         """
         await self.ensure_initialized()
         
-        try:
-            pool = await self.client.get(f"/pool/id/{pool_name}")
-        except Exception:
-            # Try getting all pools and finding by name
-            pools = await self.client.get("/pool")
-            pool = None
-            for p in pools:
-                if p.get("name") == pool_name:
-                    pool = p
-                    break
-            
-            if not pool:
-                return {
-                    "success": False,
-                    "error": f"Pool '{pool_name}' not found"
-                }
+        pool = await self._find_pool(pool_name)
+        if not pool:
+            return {
+                "success": False,
+                "error": f"Pool '{pool_name}' not found"
+            }
         
         # Extract detailed information
         size = pool.get("size", 0)
@@ -203,6 +199,7 @@ class StorageTools(BaseTool):
         }
     
     @tool_handler
+    @cached_tool(ttl=15, namespace="datasets")
     async def list_datasets(
         self,
         limit: int = 100,
@@ -222,54 +219,105 @@ class StorageTools(BaseTool):
         """
         await self.ensure_initialized()
 
-        datasets = await self.client.get("/pool/dataset")
+        limit = min(limit, self.MAX_LIMIT)
 
-        dataset_list = []
-        for ds in datasets:
-            # Calculate usage
-            used = ds.get("used", {}).get("parsed") if isinstance(ds.get("used"), dict) else ds.get("used", 0)
-            available = ds.get("available", {}).get("parsed") if isinstance(ds.get("available"), dict) else ds.get("available", 0)
-
-            dataset_info = {
-                "name": ds.get("name"),
-                "pool": ds.get("pool"),
-                "type": ds.get("type"),
-                "mountpoint": ds.get("mountpoint"),
-                "compression": ds.get("compression", {}).get("value") if isinstance(ds.get("compression"), dict) else ds.get("compression"),
-                "deduplication": ds.get("deduplication", {}).get("value") if isinstance(ds.get("deduplication"), dict) else ds.get("deduplication"),
-                "encrypted": ds.get("encrypted"),
-                "used": self.format_size(used) if isinstance(used, (int, float)) else str(used),
-                "available": self.format_size(available) if isinstance(available, (int, float)) else str(available),
-                "quota": ds.get("quota", {}).get("value") if isinstance(ds.get("quota"), dict) else ds.get("quota"),
-            }
-            # Only include children if requested
-            if include_children:
-                dataset_info["children"] = ds.get("children", [])
+        # Summarize every dataset, but format and keep only the requested page
+        paginated_datasets = []
+        total = encrypted_datasets = compressed_datasets = 0
+        by_pool: Dict[str, int] = {}
+        async for ds in self.client.iter_items("/pool/dataset"):
+            if offset <= total < offset + limit:
+                paginated_datasets.append(self._format_dataset(ds, include_children))
+            total += 1
 
-            dataset_list.append(dataset_info)
+            pool = ds.get("pool")
+            by_pool[pool] = by_pool.get(pool, 0) + 1
+            if ds.get("encrypted"):
+                encrypted_datasets += 1
+            compression = ds.get("compression", {}).get("value") if isinstance(ds.get("compression"), dict) else ds.get("compression")
+            if compression and compression != "off":
+                compressed_datasets += 1
 
-        # Organize by pool (before pagination)
-        pools_datasets = {}
-        for ds in dataset_list:
-            pool = ds["pool"]
-            if pool not in pools_datasets:
-                pools_datasets[pool] = []
-            pools_datasets[pool].append(ds)
-
-        # Apply pagination
-        paginated_datasets, pagination = self.apply_pagination(dataset_list, limit, offset)
+        pagination = self.pagination_metadata(total, limit, offset, len(paginated_datasets))
 
         return {
             "success": True,
             "datasets": paginated_datasets,
             "pagination": pagination,
             "metadata": {
-                "by_pool": {pool: len(datasets) for pool, datasets in pools_datasets.items()},
-                "encrypted_datasets": sum(1 for ds in dataset_list if ds.get("encrypted")),
-                "compressed_datasets": sum(1 for ds in dataset_list if ds.get("compression") and ds.get("compression") != "off")
+                "by_pool": by_pool,
+                "encrypted_datasets": encrypted_datasets,
+                "compressed_datasets": compressed_datasets
             }
         }
     
+    async def _find_pool(self, name: str) -> Optional[Dict[str, Any]]:
+        """Look up a single pool record by name or numeric ID, filtered by TrueNAS"""
+        name = str(name)
+        if name.isdigit():
+            # ZFS pool names start with a letter, so a number can only be an ID
+            try:
+                return await self.client.get(f"/pool/id/{name}")
+            except TrueNASAPIError as e:
+                if e.details.get("status_code") != 404:
+                    raise
+                return None
+        
+        try:
+            pools = await self.client.get("/pool", params={"name": name})
+        except TrueNASAPIError as e:
+            if e.details.get("status_code") != 400:
+                raise
+            # Releases without query-string filters reject them; scan instead
+            pools = [p for p in await self.client.get("/pool") if p.get("name") == name]
+        # A release that ignores the filter returns every pool, so match the name
+        return next((p for p in pools if p.get("name") == name), None)
+    
+    async def _find_dataset(self, name: str) -> Optional[Dict[str, Any]]:
+        """Look up a single dataset record, filtered by TrueNAS rather than locally"""
+        try:
+            datasets = await self.client.get("/pool/dataset", params={"name": name})
+        except TrueNASAPIError as e:
+            if e.details.get("status_code") != 400:
+                raise
+            # Releases without query-string filters reject them; scan instead
+            return await self._scan_datasets(name)
+        # A release that ignores the filter returns every dataset, so match the name
+        return next((ds for ds in datasets if ds.get("name") == name), None)
+    
+    async def _scan_datasets(self, name: str) -> Optional[Dict[str, Any]]:
+        """Stream /pool/dataset and return the first record named ``name``"""
+        # aclosing() releases the connection as soon as the match is found
+        async with aclosing(self.client.iter_items("/pool/dataset")) as datasets:
+            async for ds in datasets:
+                if ds.get("name") == name:
+                    return ds
+        return None
+    
+    def _format_dataset(self, ds: Dict[str, Any], include_children: bool) -> Dict[str, Any]:
+        """Project a raw /pool/dataset record onto the fields list_datasets returns"""
+        # Calculate usage
+        used = ds.get("used", {}).get("parsed") if isinstance(ds.get("used"), dict) else ds.get("used", 0)
+        available = ds.get("available", {}).get("parsed") if isinstance(ds.get("available"), dict) else ds.get("available", 0)
+
+        dataset_info = {
+            "name": ds.get("name"),
+            "pool": ds.get("pool"),
+            "type": ds.get("type"),
+            "mountpoint": ds.get("mountpoint"),
+            "compression": ds.get("compression", {}).get("value") if isinstance(ds.get("compression"), dict) else ds.get("compression"),
+            "deduplication": ds.get("deduplication", {}).get("value") if isinstance(ds.get("deduplication"), dict) else ds.get("deduplication"),
+            "encrypted": ds.get("encrypted"),
+            "used": self.format_size(used) if isinstance(used, (int, float)) else str(used),
+            "available": self.format_size(available) if isinstance(available, (int, float)) else str(available),
+            "quota": ds.get("quota", {}).get("value") if isinstance(ds.get("quota"), dict) else ds.get("quota"),
+        }
+        # Only include children if requested
+        if include_children:
+            dataset_info["children"] = ds.get("children", [])
+
+        return dataset_info
+    
     @tool_handler
     async def get_dataset(self, dataset: str, include_children: bool = True) -> Dict[str, Any]:
         """
@@ -284,13 +332,7 @@ class StorageTools(BaseTool):
         """
         await self.ensure_initialized()
 
-        datasets = await self.client.get("/pool/dataset")
-
-        target_dataset = None
-        for ds in datasets:
-            if ds.get("name") == dataset:
-                target_dataset = ds
-                break
+        target_dataset = await self._find_dataset(dataset)
 
         if not target_dataset:
             return {
@@ -341,6 +383,7 @@ class StorageTools(BaseTool):
         return result
     
     @tool_handler
+    @invalidates_cache("datasets", "pools")
     async def create_dataset(
         self,
         pool: str,
@@ -399,6 +442,7 @@ class StorageTools(BaseTool):
         }
     
     @tool_handler
+    @invalidates_cache("datasets", "pools")
     async def delete_dataset(self, dataset: str, recursive: bool = False, force: bool = False) -> Dict[str, Any]:
         """
         Delete a dataset
@@ -420,13 +464,7 @@ class StorageTools(BaseTool):
                 "error": "Destructive operations are disabled. Enable TRUENAS_ENABLE_DESTRUCTIVE_OPS to allow dataset deletion."
             }
         
-        # Find the dataset
-        datasets = await self.client.get("/pool/dataset")
-        target_dataset = None
-        for ds in datasets:
-            if ds.get("name") == dataset:
-                target_dataset = ds
-                break
+        target_dataset = await self._find_dataset(dataset)
         
         if not target_dataset:
             return {
@@ -455,6 +493,7 @@ class StorageTools(BaseTool):
         }
     
     @tool_handler
+    @invalidates_cache("datasets", "pools")
     async def update_dataset(self, dataset: str, properties: Dict[str, Any]) -> Dict[str, Any]:
         """
         Update dataset properties
@@ -468,20 +507,6 @@ class StorageTools(BaseTool):
         """
         await self.ensure_initialized()
         
-        # Find the dataset
-        datasets = await self.client.get("/pool/dataset")
-        target_dataset = None
-        for ds in datasets:
-            if ds.get("name") == dataset:
-                target_dataset = ds
-                break
-        
-        if not target_dataset:
-            return {
-                "success": False,
-                "error": f"Dataset '{dataset}' not found"
-            }
-        
         # Process properties
         processed_props = {}
         for key, value in properties.items():
@@ -490,9 +515,22 @@ class StorageTools(BaseTool):
             else:
                 processed_props[key] = value
         
-        # Update the dataset
-        dataset_id = target_dataset["id"]
-        updated = await self.client.put(f"/pool/dataset/id/{dataset_id}", processed_props)
+        # A dataset's ID is its name, so update it without looking it up first
+        try:
+            updated = await self.client.put(
+                f"/pool/dataset/id/{quote(dataset, safe='')}", processed_props
+            )
+        except TrueNASAPIError as e:
+            if e.details.get("status_code") != 404:
+                raise
+            target_dataset = await self._find_dataset(dataset)
+            if not target_dataset:
+                return {
+                    "success": False,
+                    "error": f"Dataset '{dataset}' not found"
+                }
+            dataset_id = quote(str(target_dataset["id"]), safe='')
+            updated = await self.client.put(f"/pool/dataset/id/{dataset_id}", processed_props)
         
         return {
             "success": True,
@@ -3,7 +3,32 @@ User management tools for TrueNAS
 """
 
 from typing import Dict, Any, List, Optional
-from .base import BaseTool, tool_handler
+from .base import BaseTool, cached_tool, invalidates_cache, tool_handler
+from ..exceptions import TrueNASAPIError
+
+
+# Fields returned for each user in listings, with defaults for sparse records;
+# _format_user fills groups with a fresh list so records never share one
+_USER_FIELDS = {
+    "id": None,
+    "username": None,
+    "full_name": None,
+    "email": None,
+    "uid": None,
+    "groups": None,
+    "shell": None,
+    "home": None,
+    "locked": False,
+    "sudo": False,
+    "builtin": False,
+}
+
+
+def _format_user(user: Dict[str, Any]) -> Dict[str, Any]:
+    """Project a raw /user record onto the fields the tools return"""
+    formatted = {key: user.get(key, default) for key, default in _USER_FIELDS.items()}
+    formatted["groups"] = list(user.get("groups") or [])
+    return formatted
 
 
 class UserTools(BaseTool):
@@ -17,6 +42,12 @@ class UserTools(BaseTool):
                        "description": "Max items to return (default: 100, max: 500)"},
               "offset": {"type": "integer", "required": False,
                         "description": "Items to skip for pagination"}}),
+            ("list_custom_users", self.list_custom_users,
+             "List non-builtin users, filtered server-side",
+             {"limit": {"type": "integer", "required": False,
+                       "description": "Max items to return (default: 100, max: 500)"},
+              "offset": {"type": "integer", "required": False,
+                        "description": "Items to skip for pagination"}}),
             ("get_user", self.get_user, "Get detailed information about a specific user",
              {"username": {"type": "string", "required": True}}),
             ("create_user", self.create_user, "Create a new user",
@@ -35,6 +66,7 @@ class UserTools(BaseTool):
         ]
     
     @tool_handler
+    @cached_tool(ttl=30, namespace="users")
     async def list_users(
         self,
         limit: int = BaseTool.DEFAULT_LIMIT,
@@ -52,34 +84,22 @@ class UserTools(BaseTool):
         """
         await self.ensure_initialized()
 
-        users = await self.client.get("/user")
-
-        # Filter and format user data
-        user_list = []
-        for user in users:
-            user_info = {
-                "id": user.get("id"),
-                "username": user.get("username"),
-                "full_name": user.get("full_name"),
-                "email": user.get("email"),
-                "uid": user.get("uid"),
-                "groups": user.get("groups", []),
-                "shell": user.get("shell"),
-                "home": user.get("home"),
-                "locked": user.get("locked", False),
-                "sudo": user.get("sudo", False),
-                "builtin": user.get("builtin", False)
-            }
-            user_list.append(user_info)
+        limit = min(limit, self.MAX_LIMIT)
 
-        # Categorize users (before pagination)
-        system_users = sum(1 for u in user_list if u["builtin"])
-        regular_users = sum(1 for u in user_list if not u["builtin"])
-        locked_users = sum(1 for u in user_list if u["locked"])
-        total_count = len(user_list)
+        # Categorize every user, but format and keep only the requested page
+        paginated_users = []
+        total_count = system_users = locked_users = 0
+        async for user in self.client.iter_items("/user"):
+            if offset <= total_count < offset + limit:
+                paginated_users.append(_format_user(user))
+            total_count += 1
+            if user.get("builtin", False):
+                system_users += 1
+            if user.get("locked", False):
+                locked_users += 1
+        regular_users = total_count - system_users
 
-        # Apply pagination
-        paginated_users, pagination = self.apply_pagination(user_list, limit, offset)
+        pagination = self.pagination_metadata(total_count, limit, offset, len(paginated_users))
 
         return {
             "success": True,
@@ -94,6 +114,61 @@ class UserTools(BaseTool):
         }
     
     @tool_handler
+    @cached_tool(ttl=30, namespace="users")
+    async def list_custom_users(
+        self,
+        limit: int = BaseTool.DEFAULT_LIMIT,
+        offset: int = 0
+    ) -> Dict[str, Any]:
+        """
+        List non-builtin users
+        
+        The builtin filter is applied by TrueNAS, so system accounts are
+        normally never transferred; the response is still checked locally in
+        case a release rejects or ignores the filter.
+        
+        Args:
+            limit: Maximum number of items to return (default: 100, max: 500)
+            offset: Number of items to skip for pagination
+            
+        Returns:
+            Dictionary containing list of custom users
+        """
+        await self.ensure_initialized()
+        
+        try:
+            users = await self.client.get("/user", params={"builtin": False})
+        except TrueNASAPIError as e:
+            if e.details.get("status_code") != 400:
+                raise
+            # Releases without query-string filters reject them; fetch everything
+            users = await self.client.get("/user")
+        # Filter locally as well, in case a release ignored the filter
+        users = [u for u in users if not u.get("builtin", False)]
+        
+        page, pagination = self.apply_pagination(users, limit, offset)
+        paginated_users = [_format_user(user) for user in page]
+        
+        return {
+            "success": True,
+            "users": paginated_users,
+            "pagination": pagination
+        }
+    
+    async def _find_user(self, username: str) -> Optional[Dict[str, Any]]:
+        """Look up a single user record, filtered by TrueNAS rather than locally"""
+        try:
+            users = await self.client.get("/user", params={"username": username})
+        except TrueNASAPIError as e:
+            if e.details.get("status_code") != 400:
+                raise
+            # Releases without query-string filters reject them; scan instead
+            users = [u for u in await self.client.get("/user") if u.get("username") == username]
+        # A release that ignores the filter returns every user, so match the name
+        return next((u for u in users if u.get("username") == username), None)
+    
+    @tool_handler
+    @cached_tool(ttl=30, namespace="users")
     async def get_user(self, username: str) -> Dict[str, Any]:
         """
         Get detailed information about a specific user
@@ -106,14 +181,7 @@ class UserTools(BaseTool):
         """
         await self.ensure_initialized()
         
-        # Get all users and find the specific one
-        users = await self.client.get("/user")
-        
-        target_user = None
-        for user in users:
-            if user.get("username") == username:
-                target_user = user
-                break
+        target_user = await self._find_user(username)
         
         if not target_user:
             return {
@@ -148,6 +216,7 @@ class UserTools(BaseTool):
         }
     
     @tool_handler
+    @invalidates_cache("users")
     async def create_user(
         self,
         username: str,
@@ -217,6 +286,7 @@ class UserTools(BaseTool):
         }
     
     @tool_handler
+    @invalidates_cache("users")
     async def update_user(self, username: str, updates: Dict[str, Any]) -> Dict[str, Any]:
         """
         Update an existing user
@@ -230,13 +300,7 @@ class UserTools(BaseTool):
         """
         await self.ensure_initialized()
         
-        # Find the user
-        users = await self.client.get("/user")
-        target_user = None
-        for user in users:
-            if user.get("username") == username:
-                target_user = user
-                break
+        target_user = await self._find_user(username)
         
         if not target_user:
             return {
@@ -278,6 +342,7 @@ class UserTools(BaseTool):
         }
     
     @tool_handler
+    @invalidates_cache("users")
     async def delete_user(self, username: str, delete_home: bool = False) -> Dict[str, Any]:
         """
         Delete a user
@@ -298,13 +363,7 @@ class UserTools(BaseTool):
                 "error": "Destructive operations are disabled. Enable TRUENAS_ENABLE_DESTRUCTIVE_OPS to allow user deletion."
             }
         
-        # Find the user
-        users = await self.client.get("/user")
-        target_user = None
-        for user in users:
-            if user.get("username") == username:
-                target_user = user
-                break
+        target_user = await self._find_user(username)
         
         if not target_user:
             return {